@@ -0,0 +1,186 @@
+"""
+Per-server MCP config conversions between Claude format and other platforms.
+
+These are pure dict reshuffling with no I/O, kept in their own fully
+annotated module so it can be compiled with mypyc (see pyproject.toml).
+Compiled or not, the module is imported the same way.
+"""
+
+from typing import Dict, List, Optional, TypedDict
+
+
+# Server entry schemas for each format. Configs are kept as plain dicts,
+# so keys outside these schemas (e.g. "timeout") still pass through where
+# a format copies entries as-is
+class ClaudeServer(TypedDict, total=False):
+    """A server in Claude's mcpServers (also used by Cursor and Gemini)."""
+
+    type: str  # "stdio" (default), "http" or "sse"
+    command: str
+    args: List[str]
+    env: Dict[str, str]
+    url: str
+    headers: Dict[str, str]
+
+
+class CodexServer(TypedDict, total=False):
+    """A server table in Codex's [mcp_servers]."""
+
+    command: str
+    args: List[str]
+    env: Dict[str, str]
+    url: str
+    http_headers: Dict[str, str]
+
+
+class OpenCodeServer(TypedDict, total=False):
+    """A server in OpenCode's mcp object."""
+
+    type: str  # "local" (default) or "remote"
+    command: List[str]
+    environment: Dict[str, str]
+    url: str
+    headers: Dict[str, str]
+    enabled: bool
+
+
+def _codex_stdio_to_claude(config: CodexServer) -> ClaudeServer:
+    """Convert a Codex stdio server: map command, args, env."""
+    claude_config: ClaudeServer = {}
+    if "command" in config:
+        claude_config["command"] = config["command"]
+    if "args" in config:
+        claude_config["args"] = config["args"]
+    if "env" in config:
+        claude_config["env"] = config["env"]
+    return claude_config
+
+
+def _codex_remote_to_claude(config: CodexServer) -> ClaudeServer:
+    """Convert a Codex remote/streamable HTTP server: map url and headers."""
+    claude_config: ClaudeServer = {"type": "http", "url": config["url"]}
+    if "http_headers" in config:
+        claude_config["headers"] = config["http_headers"]
+    return claude_config
+
+
+def _claude_stdio_to_codex(config: ClaudeServer) -> CodexServer:
+    """Convert a Claude stdio server: map command, args, env."""
+    codex_config: CodexServer = {}
+    if "command" in config:
+        codex_config["command"] = config["command"]
+    if "args" in config:
+        codex_config["args"] = config["args"]
+    if "env" in config:
+        codex_config["env"] = config["env"]
+    return codex_config
+
+
+def _claude_remote_to_codex(config: ClaudeServer) -> CodexServer:
+    """Convert a Claude remote (http/sse) server: map url and headers."""
+    codex_config: CodexServer = {}
+    if "url" in config:
+        codex_config["url"] = config["url"]
+    if "headers" in config:
+        codex_config["http_headers"] = config["headers"]
+    return codex_config
+
+
+def _opencode_local_to_claude(config: OpenCodeServer) -> ClaudeServer:
+    """Convert an OpenCode local server, whose command list holds the args."""
+    command_list = config.get("command", [])
+    claude_config: ClaudeServer = {
+        "command": command_list[0] if command_list else "",
+        "args": command_list[1:] if len(command_list) > 1 else [],
+    }
+    if "environment" in config:
+        claude_config["env"] = config["environment"]
+    return claude_config
+
+
+def _opencode_remote_to_claude(config: OpenCodeServer) -> ClaudeServer:
+    """Convert an OpenCode remote server to an http server."""
+    claude_config: ClaudeServer = {
+        "type": "http",
+        "url": config.get("url", ""),
+    }
+    if "headers" in config:
+        claude_config["headers"] = config["headers"]
+    return claude_config
+
+
+def _claude_stdio_to_opencode(config: ClaudeServer) -> OpenCodeServer:
+    """Convert a Claude stdio server to an OpenCode local server."""
+    command_list = [config.get("command", "")]
+    if "args" in config:
+        command_list.extend(config["args"])
+    opencode_config: OpenCodeServer = {
+        "type": "local",
+        "command": command_list,
+        "enabled": True,
+    }
+    if "env" in config:
+        opencode_config["environment"] = config["env"]
+    return opencode_config
+
+
+def _claude_remote_to_opencode(config: ClaudeServer) -> OpenCodeServer:
+    """Convert a Claude remote (http/sse) server to an OpenCode remote server."""
+    opencode_config: OpenCodeServer = {
+        "type": "remote",
+        "url": config.get("url", ""),
+        "enabled": True,
+    }
+    if "headers" in config:
+        opencode_config["headers"] = config["headers"]
+    return opencode_config
+
+
+# Converter for each server type, looked up once per server instead of
+# branching on the type. Codex has no type field, so it is keyed by
+# whether the server has a url. Claude types other than http/sse are
+# treated as stdio for Codex, and OpenCode types other than local (or
+# Claude types other than stdio) as remote, as before.
+_CODEX_TO_CLAUDE = {True: _codex_remote_to_claude, False: _codex_stdio_to_claude}
+_CLAUDE_TO_CODEX = {"http": _claude_remote_to_codex, "sse": _claude_remote_to_codex}
+_OPENCODE_TO_CLAUDE = {"local": _opencode_local_to_claude}
+_CLAUDE_TO_OPENCODE = {"stdio": _claude_stdio_to_opencode}
+
+
+def codex_to_claude(config: CodexServer) -> Optional[ClaudeServer]:
+    """Convert a Codex server config to Claude format (None if unusable)."""
+    return _CODEX_TO_CLAUDE["url" in config](config) or None
+
+
+def claude_to_codex(config: ClaudeServer) -> Optional[CodexServer]:
+    """Convert a Claude server config to Codex format (None if unusable)."""
+    convert = _CLAUDE_TO_CODEX.get(config.get("type", "stdio"), _claude_stdio_to_codex)
+    return convert(config) or None
+
+
+def opencode_to_claude(config: OpenCodeServer) -> ClaudeServer:
+    """Convert an OpenCode server config to Claude format."""
+    convert = _OPENCODE_TO_CLAUDE.get(config.get("type", "local"), _opencode_remote_to_claude)
+    return convert(config)
+
+
+def claude_to_opencode(config: ClaudeServer) -> OpenCodeServer:
+    """Convert a Claude server config to OpenCode format."""
+    convert = _CLAUDE_TO_OPENCODE.get(config.get("type", "stdio"), _claude_remote_to_opencode)
+    return convert(config)
+
+
+def servers_to_codex(servers: Dict[str, ClaudeServer]) -> Dict[str, CodexServer]:
+    """Convert Claude-format servers to a Codex mcp_servers table."""
+    codex_servers: Dict[str, CodexServer] = {}
+    for name, config in servers.items():
+        codex_config = claude_to_codex(config)
+        # Skip servers with no usable config (avoids empty TOML sections)
+        if codex_config is not None:
+            codex_servers[name] = codex_config
+    return codex_servers
+
+
+def servers_to_opencode(servers: Dict[str, ClaudeServer]) -> Dict[str, OpenCodeServer]:
+    """Convert Claude-format servers to an OpenCode mcp object."""
+    return {name: claude_to_opencode(config) for name, config in servers.items()}
@@ -0,0 +1,292 @@
+"""Filesystem helpers for walking and copying skill trees and writing files."""
+
+import mmap
+import os
+import shutil
+import sys
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, Iterator, Optional, Tuple, Union
+
+
+# Files at least this large are memory-mapped by read_mapped instead of read;
+# below it the mmap setup costs more than copying the bytes
+_MMAP_THRESHOLD = 64 * 1024
+
+# cached_load results: (path, loader) -> ((mtime_ns, size, inode), parsed).
+# Only a handful of config files are ever read, so the cache stays small
+_PARSE_CACHE: Dict[Tuple[str, Callable], Tuple[Tuple[int, int, int], Any]] = {}
+_PARSE_CACHE_SIZE = 16
+_PARSE_CACHE_LOCK = threading.Lock()
+
+# Linux ioctl that makes dst share src's extents (Btrfs, XFS, bcachefs, ...)
+_FICLONE = 0x40049409
+
+
+def _ficlone(src: str, dst: str):
+    """Clone src into dst with the FICLONE ioctl (Linux)."""
+    import fcntl
+
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+
+
+@lru_cache(maxsize=1)
+def _clone_function() -> Optional[Callable[[str, str], None]]:
+    """
+    Return the platform's copy-on-write file clone call, or None.
+
+    Resolved once per process. The returned function raises OSError when
+    the filesystem (or a cross-device copy) doesn't support cloning.
+    """
+    if sys.platform.startswith("linux"):
+        return _ficlone
+
+    if sys.platform == "darwin":
+        import ctypes
+        import ctypes.util
+
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+            clonefile = libc.clonefile
+        except (OSError, AttributeError):
+            return None
+        clonefile.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_uint32]
+
+        def _clonefile(src: str, dst: str):
+            """Clone src into dst with clonefile(2) (APFS)."""
+            if clonefile(os.fsencode(src), os.fsencode(dst), 0) != 0:
+                err = ctypes.get_errno()
+                raise OSError(err, os.strerror(err), src)
+
+        return _clonefile
+
+    return None
+
+
+def copytree(src: Path, dst: Path, dirs_exist_ok: bool = False) -> Path:
+    """
+    Copy a directory tree like shutil.copytree, using reflinks where possible.
+
+    On copy-on-write filesystems (APFS, Btrfs, XFS with reflink) each file is
+    cloned instead of having its bytes rewritten. If cloning fails once, e.g.
+    because src and dst are on different filesystems, the rest of the tree is
+    copied with shutil.copy2.
+    """
+    clone = _clone_function()
+    state = {"clone": clone is not None}
+
+    def copy_function(s: str, d: str) -> str:
+        if state["clone"]:
+            try:
+                clone(s, d)
+                shutil.copystat(s, d)
+                return d
+            except OSError:
+                state["clone"] = False
+        return shutil.copy2(s, d)
+
+    return shutil.copytree(src, dst, copy_function=copy_function, dirs_exist_ok=dirs_exist_ok)
+
+
+def write_bytes_if_changed(path, data: bytes) -> bool:
+    """
+    Atomically replace the file at path with data unless it already holds it.
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+    except FileNotFoundError:
+        pass
+    atomic_write_bytes(path, data)
+    return True
+
+
+@contextmanager
+def read_mapped(path) -> Iterator[Union[bytes, mmap.mmap]]:
+    """
+    Yield a file's contents, memory-mapped when the file is large.
+
+    Small files are read into bytes. Large ones (e.g. a ~/.claude.json full
+    of unrelated state) are yielded as a read-only mmap, which supports
+    find() and the buffer protocol, so _json.loads can parse it without
+    copying. The mapping is only valid inside the with block.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_THRESHOLD:
+            yield f.read()
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def cached_load(path, loader: Callable[[Any], Any]) -> Any:
+    """
+    Parse a file with loader, reusing the last result while the file is unchanged.
+
+    The file's (mtime_ns, size, inode) is checked with one stat call, and
+    loader is only run on a miss; it receives the contents as read_mapped
+    yields them. atomic_write_bytes drops a file's entries, so writes made
+    through it are never masked by a same-size edit within mtime resolution.
+
+    The parsed result is shared between callers and must not be mutated;
+    code that edits a config should parse its own copy. OSError and loader
+    errors propagate as with a direct read.
+    """
+    key = (os.fspath(path), loader)
+    st = os.stat(key[0])
+    signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+    with _PARSE_CACHE_LOCK:
+        cached = _PARSE_CACHE.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    with read_mapped(path) as raw:
+        parsed = loader(raw)
+    with _PARSE_CACHE_LOCK:
+        _PARSE_CACHE.pop(key, None)
+        if len(_PARSE_CACHE) >= _PARSE_CACHE_SIZE:
+            # Dicts keep insertion order, so this evicts the oldest entry
+            del _PARSE_CACHE[next(iter(_PARSE_CACHE))]
+        _PARSE_CACHE[key] = (signature, parsed)
+    return parsed
+
+
+def _forget_parsed(*paths: str):
+    """Drop cached_load results for the given file paths."""
+    with _PARSE_CACHE_LOCK:
+        for key in [key for key in _PARSE_CACHE if key[0] in paths]:
+            del _PARSE_CACHE[key]
+
+
+def rmtree(path):
+    """
+    Remove a skill directory, a symlink to one, or a stray file.
+
+    shutil.rmtree refuses symlinks, but skills are often symlinked into a
+    platform's folder; those links are unlinked without touching their
+    target. Real directories go to shutil.rmtree, which already deletes
+    with openat/unlinkat relative to directory fds where the OS allows it.
+    """
+    if os.path.islink(path) or not os.path.isdir(path):
+        os.unlink(path)
+    else:
+        shutil.rmtree(path)
+
+
+def tree_signature(root) -> Optional[FrozenSet[tuple]]:
+    """
+    Summarize a directory tree as its (relative path, size, mtime_ns, mode)
+    entries.
+
+    Symlinks are followed, as copytree does when copying, so a source tree
+    and a fresh copytree of it have equal signatures (copies keep mtimes
+    and permission bits). The mode is included so a chmod alone, which
+    leaves size and mtime as they were, still counts as a change.
+    Directories contribute only their relative path. Returns None if any
+    part of the tree can't be read.
+    """
+    entries = set()
+    stack = [(os.fspath(root), "")]
+    try:
+        while stack:
+            dir_path, prefix = stack.pop()
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    rel_path = prefix + entry.name
+                    if entry.is_dir():
+                        entries.add((rel_path,))
+                        stack.append((entry.path, rel_path + os.sep))
+                    else:
+                        st = entry.stat()
+                        entries.add((rel_path, st.st_size, st.st_mtime_ns, st.st_mode))
+    except OSError:
+        return None
+    return frozenset(entries)
+
+
+def iter_named(root, name: str) -> Iterator[str]:
+    """
+    Yield the path of every entry called name below root, like
+    Path.rglob(name) but without building a Path per directory entry.
+
+    Walks with os.scandir and an explicit stack; symlinked directories are
+    not descended into and unreadable directories are skipped, as with rglob.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.name == name:
+                        yield entry.path
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+
+# How many temporary file names _create_temp tries, as tempfile.mkstemp does
+_TEMP_ATTEMPTS = 100
+
+
+def _create_temp(path: str) -> Tuple[int, str]:
+    """
+    Create a new, empty temporary file next to path, for atomic_write_bytes.
+
+    Unlike tempfile.mkstemp (which uses mode 0o600), the file is created
+    with mode 0o666 so the kernel applies the process umask itself, giving
+    a new config the permissions any other new file would get. (Reading
+    the umask with os.umask would briefly change it for every thread.)
+
+    Returns:
+        Tuple of (open file descriptor, temporary file path)
+    """
+    directory, name = os.path.split(path)
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    for _ in range(_TEMP_ATTEMPTS):
+        tmp_path = os.path.join(directory, f".{name}.{os.urandom(6).hex()}.tmp")
+        try:
+            return os.open(tmp_path, flags, 0o666), tmp_path
+        except FileExistsError:
+            continue
+    raise FileExistsError(f"No usable temporary file name found next to {path}")
+
+
+def atomic_write_bytes(path, data: bytes):
+    """
+    Replace the file at path with data without ever leaving it half written.
+
+    The bytes go to a temporary file in the same directory, which is then
+    renamed over the target with os.replace. A symlinked target is written
+    through to the file it points at, and an existing file keeps its mode.
+    Any cached_load result for the file is discarded.
+    """
+    real_path = os.path.realpath(path)
+    _forget_parsed(os.fspath(path), real_path)
+    path = real_path
+    fd, tmp_path = _create_temp(path)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        try:
+            shutil.copymode(path, tmp_path)
+        except FileNotFoundError:
+            # New file: keep the umask-derived mode it was created with
+            pass
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
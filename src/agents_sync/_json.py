@@ -0,0 +1,74 @@
+"""JSON parsing and serialization that use orjson when it is installed."""
+
+import io
+import json
+from functools import lru_cache
+
+# orjson is optional (pip install agents-sync[fast]); its JSONDecodeError
+# subclasses json.JSONDecodeError, so callers only need to catch the latter
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data):
+    """Parse JSON from bytes, str, or a buffer such as an mmap."""
+    if isinstance(data, (bytes, str)):
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
+    if orjson is not None:
+        # orjson reads any memoryview in place; releasing the view on the
+        # way out (even on error) lets the caller close the mmap behind it
+        with memoryview(data) as view:
+            return orjson.loads(view)
+    return json.loads(bytes(data))
+
+
+def dumps(obj) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes indented by two spaces."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+@lru_cache(maxsize=1)
+def _get_ijson():
+    """
+    Import ijson on first use, or return None if it isn't installed.
+
+    ijson is optional too (pip install agents-sync[stream]) and only
+    load_key needs it, so it is kept off the import path of every command.
+    """
+    try:
+        import ijson
+    except ImportError:
+        return None
+    return ijson
+
+
+def load_key(data, key: str) -> dict:
+    """
+    Parse the object under a top-level key of a JSON document, or {} if absent.
+
+    orjson parses whole documents faster than ijson streams them, so with
+    orjson installed this is a full parse. Otherwise, if ijson is installed,
+    only the key's subtree is built. data may be bytes or an mmap (anything
+    with a read() method is streamed from its current position).
+
+    Raises:
+        ValueError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return loads(data).get(key, {})
+    ijson = _get_ijson()
+    if ijson is None:
+        return loads(data).get(key, {})
+    stream = data if hasattr(data, "read") else io.BytesIO(data)
+    try:
+        # use_float keeps numbers as float, as json.loads does, rather
+        # than ijson's default Decimal (which the dumpers can't serialize)
+        return dict(ijson.kvitems(stream, key, use_float=True))
+    except ijson.JSONError as e:
+        raise ValueError(f"Invalid JSON: {e}") from e
@@ -1,102 +1,147 @@
 """CLI interface using Typer."""
 
+from __future__ import annotations
+
+import sys
 import typer
-import json
-from typing import Optional, List
-from datetime import datetime
+from os import fspath
+from functools import lru_cache
+# Optional is only kept for the typer option annotations: typer evaluates
+# them at runtime, and "str | None" does not evaluate before Python 3.10
+from typing import Optional
 from pathlib import Path
-from rich.console import Console
-from rich.table import Table
-from rich.prompt import Prompt, Confirm
-import inquirer
 
-from .config import load_config, save_config, Config, save_agents_info, load_agents_info, BACKUP_DIR
-from .platforms import Platform, get_all_platforms, get_platform_display_name, get_platform_paths
-from .core import scan_skills, clean_skills, sync_skills, backup_skills, list_backups, restore_skills
-from .mcp import read_mcp_servers, clean_mcp_servers
+from .config import Config, load_config, save_config, save_agents_info, load_agents_info, BACKUP_DIR
+
+@lru_cache(maxsize=1)
+def _console():
+    """Create the rich console on first use (rich is imported lazily)."""
+    from rich.console import Console
+    return Console()
+
+
+@lru_cache(maxsize=1)
+def _config() -> Config:
+    """
+    Load the config once per invocation, for read-only use.
+
+    The config command edits and saves the config, so it calls load_config()
+    directly instead of sharing this instance.
+    """
+    return load_config()
+
+
+@lru_cache(maxsize=1)
+def _platforms() -> dict:
+    """All platforms keyed by value, built once per invocation."""
+    from .platforms import get_all_platforms
+    return get_all_platforms()
+
+
+@lru_cache(maxsize=1)
+def _display_names() -> dict:
+    """Display name for each platform key."""
+    from .platforms import get_platform_display_name
+    return {k: get_platform_display_name(p) for k, p in _platforms().items()}
+
 
-app = typer.Typer(help="Agents Sync - Sync agent skills and MCP servers across platforms")
-console = Console()
+def _emit_table(title: str | None, columns: list[tuple], rows: list[tuple], **table_kwargs):
+    """
+    Print rows as a rich table, or as plain tab-separated lines when
+    stdout is not a terminal (skips rich's layout pass and is easier to grep).
+
+    Args:
+        title: Table title, or None
+        columns: (header, style) pairs
+        rows: Tuples of cell strings, one per column
+        table_kwargs: Extra rich Table options for terminal output
+    """
+    console = _console()
+
+    if not console.is_terminal:
+        if title:
+            print(title)
+        print("\t".join(header for header, _ in columns))
+        for row in rows:
+            print("\t".join(cell.replace("\n", ", ") for cell in row))
+        return
+
+    from rich.table import Table
+
+    table = Table(title=title, **table_kwargs)
+    for header, style in columns:
+        table.add_column(header, style=style)
+    for row in rows:
+        table.add_row(*row)
+    console.print(table)
 
 
 def display_platforms():
     """Display available platforms in a table."""
-    table = Table(title="Available Platforms")
-    table.add_column("Key", style="cyan")
-    table.add_column("Name", style="green")
-    table.add_column("Paths", style="yellow")
-    
-    platforms = get_all_platforms()
+    from .platforms import get_platform_paths
+
+    rows = []
+    platforms = _platforms()
     for key, platform in platforms.items():
-        paths = get_platform_paths(platform)
-        path_str = "\n".join([str(p) for p in paths if p.exists()])
+        # Stat each path once; fall back to all paths if none exist yet
+        stat_map = [(p, p.exists()) for p in get_platform_paths(platform)]
+        path_str = "\n".join(fspath(p) for p, exists in stat_map if exists)
         if not path_str:
-            path_str = "\n".join([str(p) for p in paths])
-        table.add_row(key, get_platform_display_name(platform), path_str)
+            path_str = "\n".join(fspath(p) for p, _ in stat_map)
+        rows.append((key, _display_names()[key], path_str))
     
-    console.print(table)
+    _emit_table("Available Platforms", [("Key", "cyan"), ("Name", "green"), ("Paths", "yellow")], rows)
 
 
-def select_forks_checklist(platforms: dict, master_key: str, current_forks: List[str]) -> List[str]:
+def select_forks_checklist(platforms: dict, master_key: str, current_forks: list[str]) -> list[str]:
     """Interactive checklist for selecting fork platforms."""
-    available_keys = [k for k in platforms.keys() if k != master_key]
+    import questionary
+
+    # Create checklist options with display names, pre-checking current forks
+    current = set(current_forks)
+    choices = [
+        questionary.Choice(f"{key} - {_display_names()[key]}", value=key, checked=key in current)
+        for key in platforms
+        if key != master_key
+    ]
     
-    if not available_keys:
+    if not choices:
         return []
     
-    # Create checklist options with display names
-    choices = []
-    for key in available_keys:
-        platform_name = get_platform_display_name(platforms[key])
-        choices.append((f"{key} - {platform_name}", key))
-    
-    # Use inquirer checkbox
-    questions = [
-        inquirer.Checkbox(
-            'forks',
-            message="Select fork platforms (use space to toggle, enter to confirm)",
-            choices=choices,
-            default=[k for k in current_forks if k in available_keys],
-        ),
-    ]
+    # Use questionary checkbox
+    answer = questionary.checkbox(
+        "Select fork platforms (use space to toggle, enter to confirm)",
+        choices=choices,
+    ).ask()
     
-    answers = inquirer.prompt(questions)
-    
-    if answers and 'forks' in answers:
-        return answers['forks']
-    return []
+    return answer or []
 
 
-def select_master_checklist(platforms: dict, current_master: Optional[str]) -> str:
+def select_master_checklist(platforms: dict, current_master: str | None) -> str:
     """Interactive checklist for selecting master platform."""
+    import questionary
+
     # Create list options with display names
-    choices = []
-    for key in platforms.keys():
-        platform_name = get_platform_display_name(platforms[key])
-        choices.append((f"{key} - {platform_name}", key))
-    
-    # Use inquirer list for single selection
-    questions = [
-        inquirer.List(
-            'master',
-            message="Select master platform",
-            choices=choices,
-            default=current_master or choices[0][1] if choices else None,
-        ),
+    choices = [
+        questionary.Choice(f"{key} - {_display_names()[key]}", value=key)
+        for key in platforms
     ]
     
-    answers = inquirer.prompt(questions)
+    # Use questionary select for single selection
+    answer = questionary.select(
+        "Select master platform",
+        choices=choices,
+        default=current_master if current_master in platforms else None,
+    ).ask()
     
-    if answers and 'master' in answers:
-        return answers['master']
-    return current_master or list(platforms.keys())[0]
+    return answer or current_master or next(iter(platforms))
 
 
-@app.command()
 def config():
     """Configure master and fork platforms."""
+    console = _console()
     config = load_config()
-    platforms = get_all_platforms()
+    platforms = _platforms()
     
     console.print("\n[bold cyan]Current Configuration:[/bold cyan]")
     console.print(f"Master: {config.master or 'Not set'}")
@@ -127,12 +172,15 @@ def config():
     console.print(f"Forks: {', '.join(fork_keys) if fork_keys else 'None'}")
 
 
-@app.command()
 def scan(
     platform: Optional[str] = typer.Option(None, "--platform", "-p", help="Platform to scan (defaults to master)")
 ):
     """Scan skills in the master platform's skill folder."""
-    platforms = get_all_platforms()
+    from .core import scan_skills
+    from .mcp import format_source, read_mcp_servers
+
+    console = _console()
+    platforms = _platforms()
     
     if platform:
         if platform not in platforms:
@@ -141,24 +189,19 @@ def scan(
         scan_platform = platforms[platform]
         platform_key = platform
     else:
-        config = load_config()
+        config = _config()
         if not config.master:
             console.print("[bold red]Error: No master platform configured. Run 'agents config' first.[/bold red]")
             raise typer.Exit(1)
         scan_platform = platforms[config.master]
         platform_key = config.master
     
-    console.print(f"\n[bold cyan]Scanning {get_platform_display_name(scan_platform)}...[/bold cyan]")
+    console.print(f"\n[bold cyan]Scanning {_display_names()[platform_key]}...[/bold cyan]")
     
     skills = scan_skills(scan_platform)
     
-    # Prepare skills info for saving
-    skills_info = []
-    for skill in skills:
-        skills_info.append({
-            "name": skill.name,
-            "path": str(skill)
-        })
+    # Prepare skills info for saving (also reused for the table below)
+    skills_info = [{"name": skill.name, "path": fspath(skill)} for skill in skills]
     
     # Scan MCP servers from any platform
     mcp_servers, mcp_sources = read_mcp_servers(scan_platform)
@@ -177,82 +220,85 @@ def scan(
 
     # Display skills
     if skills:
-        table = Table(title=f"Found {len(skills)} skill(s)")
-        table.add_column("Skill Name", style="cyan")
-        table.add_column("Path", style="yellow")
-
-        for skill in skills:
-            table.add_row(skill.name, str(skill))
-
-        console.print(table)
+        _emit_table(
+            f"Found {len(skills)} skill(s)",
+            [("Skill Name", "cyan"), ("Path", "yellow")],
+            [(skill["name"], skill["path"]) for skill in skills_info],
+        )
 
     # Display MCP servers
     if mcp_servers:
         console.print(f"\n[bold cyan]MCP Servers ({len(mcp_servers)}):[/bold cyan]")
         for source in mcp_sources:
-            console.print(f"  • {source}")
+            console.print(f"  • {format_source(source)}")
 
     console.print(f"\n[dim]Info saved to config directory.[/dim]")
 
 
-@app.command()
 def clean(
     target: str = typer.Argument(..., help="'master' or 'fork'"),
-    dry_run: bool = typer.Option(False, "--dry-run", help="Show what would be deleted without actually deleting")
+    dry_run: bool = typer.Option(False, "--dry-run", help="Show what would be deleted without actually deleting"),
+    yes: bool = typer.Option(False, "--yes", "-y", help="Skip the confirmation prompt")
 ):
     """Clean all skills from master or fork platforms."""
-    config = load_config()
-    platforms = get_all_platforms()
+    from concurrent.futures import ThreadPoolExecutor
+    from .core import clean_skills
+    from .mcp import clean_mcp_servers
+
+    console = _console()
+    config = _config()
+    platforms = _platforms()
+    display_names = _display_names()
     
     if target == "master":
         if not config.master:
             console.print("[bold red]Error: No master platform configured. Run 'agents config' first.[/bold red]")
             raise typer.Exit(1)
-        platform = platforms[config.master]
-        platform_name = get_platform_display_name(platform)
+        targets = [config.master]
     elif target == "fork":
         if not config.forks:
             console.print("[bold red]Error: No fork platforms configured. Run 'agents config' first.[/bold red]")
             raise typer.Exit(1)
-        # Clean all forks
-        for fork_key in config.forks:
-            platform = platforms[fork_key]
-            platform_name = get_platform_display_name(platform)
-            console.print(f"\n[bold cyan]Cleaning {platform_name}...[/bold cyan]")
-            deleted = clean_skills(platform, dry_run=dry_run)
-            mcp_deleted = clean_mcp_servers(platform, dry_run=dry_run)
-            if dry_run:
-                console.print(f"[yellow]Would delete {deleted} skill(s), {mcp_deleted} MCP server(s)[/yellow]")
-            else:
-                console.print(f"[green]Deleted {deleted} skill(s), {mcp_deleted} MCP server(s)[/green]")
-        return
+        targets = list(config.forks)
     else:
         console.print(f"[bold red]Error: Target must be 'master' or 'fork', got '{target}'[/bold red]")
         raise typer.Exit(1)
     
-    console.print(f"\n[bold cyan]Cleaning {platform_name}...[/bold cyan]")
-    
-    if not dry_run:
-        if not Confirm.ask(f"Are you sure you want to delete all skills from {platform_name}?"):
+    # Cleaning the master is destructive to the source of truth, so confirm first
+    if target == "master" and not dry_run and not yes:
+        from rich.prompt import Confirm
+        if not Confirm.ask(f"Are you sure you want to delete all skills from {display_names[config.master]}?"):
             console.print("[yellow]Cancelled.[/yellow]")
             return
     
-    deleted = clean_skills(platform, dry_run=dry_run)
-    mcp_deleted = clean_mcp_servers(platform, dry_run=dry_run)
-
-    if dry_run:
-        console.print(f"[yellow]Would delete {deleted} skill(s), {mcp_deleted} MCP server(s)[/yellow]")
-    else:
-        console.print(f"[green]Deleted {deleted} skill(s), {mcp_deleted} MCP server(s)[/green]")
+    def clean_one(key: str) -> tuple:
+        return clean_skills(platforms[key], dry_run=dry_run), clean_mcp_servers(platforms[key], dry_run=dry_run)
+    
+    # Platforms live in separate directory trees, so clean them concurrently;
+    # results are reported in target order
+    with ThreadPoolExecutor(max_workers=min(len(targets), 8)) as executor:
+        futures = [executor.submit(clean_one, key) for key in targets]
+    
+    for key, future in zip(targets, futures):
+        console.print(f"\n[bold cyan]Cleaning {display_names[key]}...[/bold cyan]")
+        deleted, mcp_deleted = future.result()
+        if dry_run:
+            console.print(f"[yellow]Would delete {deleted} skill(s), {mcp_deleted} MCP server(s)[/yellow]")
+        else:
+            console.print(f"[green]Deleted {deleted} skill(s), {mcp_deleted} MCP server(s)[/green]")
 
 
-@app.command()
 def sync(
     dry_run: bool = typer.Option(False, "--dry-run", help="Show what would be synced without actually syncing")
 ):
     """Sync skills from master to all fork platforms."""
-    config = load_config()
-    platforms = get_all_platforms()
+    from concurrent.futures import ThreadPoolExecutor
+    from .core import sync_skills
+
+    console = _console()
+    config = _config()
+    platforms = _platforms()
+    display_names = _display_names()
     
     if not config.master:
         console.print("[bold red]Error: No master platform configured. Run 'agents config' first.[/bold red]")
@@ -265,9 +311,26 @@ def sync(
     master_platform = platforms[config.master]
     fork_platforms = [platforms[key] for key in config.forks]
     
-    console.print(f"\n[bold cyan]Syncing from {get_platform_display_name(master_platform)}...[/bold cyan]")
-    
-    results = sync_skills(master_platform, fork_platforms, config.master, dry_run=dry_run)
+    console.print(f"\n[bold cyan]Syncing from {display_names[config.master]}...[/bold cyan]")
+    
+    # Sync each fork in its own thread so their copy I/O overlaps, then merge
+    # the per-fork results (master counts are identical across them)
+    with ThreadPoolExecutor(max_workers=min(len(fork_platforms), 8)) as executor:
+        fork_results = list(executor.map(
+            lambda fork: sync_skills(master_platform, [fork], config.master, dry_run=dry_run),
+            fork_platforms,
+        ))
+    
+    results = dict(fork_results[0])
+    results["synced_to"] = {}
+    results["unchanged"] = {}
+    results["mcp_synced_to"] = {}
+    results["mcp_unchanged"] = {}
+    for fork_result in fork_results:
+        results["synced_to"].update(fork_result["synced_to"])
+        results["unchanged"].update(fork_result.get("unchanged", {}))
+        results["mcp_synced_to"].update(fork_result.get("mcp_synced_to", {}))
+        results["mcp_unchanged"].update(fork_result.get("mcp_unchanged", {}))
     
     # Check for error message
     if "error" in results:
@@ -277,7 +340,7 @@ def sync(
     # Display sync summary
     skill_count = results['master_skills']
     mcp_count = results.get('mcp_synced', 0)
-    fork_names = ", ".join(get_platform_display_name(platforms[k]) for k in results['synced_to'])
+    fork_names = ", ".join(display_names[k] for k in results['synced_to'])
 
     console.print(f"\n[bold cyan]Synced to:[/bold cyan] {fork_names}")
     if dry_run:
@@ -285,32 +348,46 @@ def sync(
         if mcp_count > 0:
             console.print(f"  MCP Servers: [yellow]Would sync {mcp_count}[/yellow]")
     else:
-        console.print(f"  Skills: [green]{skill_count} synced[/green]")
-        if mcp_count > 0:
-            console.print(f"  MCP Servers: [green]{mcp_count} synced[/green]")
+        # Per fork, in one unit: master skills copied vs. already up to date
+        for key, synced_count in results["synced_to"].items():
+            line = f"  Skills ({display_names[key]}): [green]{synced_count} synced[/green]"
+            unchanged_count = results["unchanged"].get(key, 0)
+            if unchanged_count > 0:
+                line += f", [dim]{unchanged_count} already up to date[/dim]"
+            console.print(line)
+        # Likewise for MCP servers, counted in each fork's config
+        for key, synced_count in results["mcp_synced_to"].items():
+            line = f"  MCP Servers ({display_names[key]}): [green]{synced_count} synced[/green]"
+            unchanged_count = results["mcp_unchanged"].get(key, 0)
+            if unchanged_count > 0:
+                line += f", [dim]{unchanged_count} already up to date[/dim]"
+            console.print(line)
 
 
-@app.command()
 def backup(
     platform: Optional[str] = typer.Option(None, "--platform", "-p", help="Platform to backup (defaults to master)"),
     dry_run: bool = typer.Option(False, "--dry-run", help="Show what would be backed up without actually backing up")
 ):
     """Backup all skills from master platform."""
-    platforms = get_all_platforms()
+    from .core import backup_skills
+
+    console = _console()
+    platforms = _platforms()
     
     if platform:
         if platform not in platforms:
             console.print(f"[bold red]Error: Invalid platform '{platform}'[/bold red]")
             raise typer.Exit(1)
-        backup_platform = platforms[platform]
+        backup_key = platform
     else:
-        config = load_config()
+        config = _config()
         if not config.master:
             console.print("[bold red]Error: No master platform configured. Run 'agents config' first.[/bold red]")
             raise typer.Exit(1)
-        backup_platform = platforms[config.master]
+        backup_key = config.master
+    backup_platform = platforms[backup_key]
     
-    console.print(f"\n[bold cyan]Backing up {get_platform_display_name(backup_platform)}...[/bold cyan]")
+    console.print(f"\n[bold cyan]Backing up {_display_names()[backup_key]}...[/bold cyan]")
     
     backup_path = backup_skills(backup_platform, dry_run=dry_run)
     
@@ -320,11 +397,19 @@ def backup(
         console.print(f"[green]Backup created at: {backup_path}[/green]")
 
 
-@app.command()
+def _scanned_skills(platform_info) -> list:
+    """Skills list from a platform's agents_info.json entry (new dict or old list format)."""
+    if isinstance(platform_info, dict):
+        return platform_info.get("skills", [])
+    return platform_info or []
+
+
 def info():
     """Display current master-fork config and existing skills information."""
-    config = load_config()
-    platforms = get_all_platforms()
+    console = _console()
+    config = _config()
+    platforms = _platforms()
+    display_names = _display_names()
     skills_info = load_agents_info()
     
     # Display configuration
@@ -342,17 +427,18 @@ def info():
     if config.master:
         master_platform = platforms.get(config.master)
         if master_platform:
-            master_skills = skills_info.get(config.master, [])
+            master_skills = _scanned_skills(skills_info.get(config.master))
             if master_skills:
-                console.print(f"\n[bold green]Master ({get_platform_display_name(master_platform)}):[/bold green]")
-                table = Table(show_header=True, header_style="bold magenta")
-                table.add_column("Skill Name", style="cyan")
-                table.add_column("Path", style="yellow")
-                for skill in master_skills:
-                    table.add_row(skill["name"], skill["path"])
-                console.print(table)
+                console.print(f"\n[bold green]Master ({display_names[config.master]}):[/bold green]")
+                _emit_table(
+                    None,
+                    [("Skill Name", "cyan"), ("Path", "yellow")],
+                    [(skill["name"], skill["path"]) for skill in master_skills],
+                    show_header=True,
+                    header_style="bold magenta",
+                )
             else:
-                console.print(f"\n[bold green]Master ({get_platform_display_name(master_platform)}):[/bold green] [yellow]No skills scanned[/yellow]")
+                console.print(f"\n[bold green]Master ({display_names[config.master]}):[/bold green] [yellow]No skills scanned[/yellow]")
     
     # Show fork skills
     if config.forks:
@@ -360,12 +446,12 @@ def info():
         for fork_key in config.forks:
             fork_platform = platforms.get(fork_key)
             if fork_platform:
-                fork_skills = skills_info.get(fork_key, [])
-                platform_name = get_platform_display_name(fork_platform)
+                fork_skills = _scanned_skills(skills_info.get(fork_key))
+                platform_name = display_names[fork_key]
                 if fork_skills:
                     console.print(f"\n  [bold]{platform_name}:[/bold] {len(fork_skills)} skill(s)")
-                    for skill in fork_skills:
-                        console.print(f"    • {skill['name']}")
+                    # One print call for the whole list instead of one render per skill
+                    console.print("\n".join(f"    • {skill['name']}" for skill in fork_skills))
                 else:
                     console.print(f"\n  [bold]{platform_name}:[/bold] [yellow]No skills scanned[/yellow]")
     
@@ -373,72 +459,87 @@ def info():
         console.print("\n[yellow]No configuration set. Run 'agents config' to configure master and forks.[/yellow]")
 
 
-@app.command()
 def platforms():
     """List all available platforms and their paths."""
     display_platforms()
 
 
-def select_backup_checklist(backups: List[Path]) -> Optional[Path]:
-    """Interactive checklist for selecting a backup to restore."""
+def _read_backup_info(backup_path: Path) -> tuple:
+    """Read a backup's agents_info.json; returns (backup_path, info or None)."""
+    from . import _json
+
+    try:
+        return backup_path, _json.loads((backup_path / "agents_info.json").read_bytes())
+    except (OSError, ValueError):  # missing/unreadable file or bad JSON
+        return backup_path, None
+
+
+def select_backup_checklist(backups: list[Path]) -> tuple[Path, dict] | None:
+    """
+    Interactive checklist for selecting a backup to restore.
+
+    Returns:
+        (backup_path, parsed agents_info.json) for the selected backup, with
+        an empty dict if its info file could not be read; None if cancelled
+    """
+    import questionary
+    from concurrent.futures import ThreadPoolExecutor
+
     if not backups:
         return None
     
+    # Read all backup info files concurrently; each is a small, I/O-bound read
+    with ThreadPoolExecutor(max_workers=min(8, len(backups))) as executor:
+        results = list(executor.map(_read_backup_info, backups))
+    
     # Create list options with display names
     choices = []
-    for backup_path in backups:
-        # Parse backup info to get platform and timestamp
-        info_file = backup_path / "agents_info.json"
-        if info_file.exists():
-            try:
-                with open(info_file, 'r') as f:
-                    info = json.load(f)
-                    platform = info.get("platform", "unknown")
-                    timestamp = info.get("timestamp", "")
-                    skill_count = len(info.get("skills", []))
-                    
-                    # Format timestamp for display
-                    if timestamp:
-                        try:
-                            dt = datetime.strptime(timestamp, "%Y%m%d_%H%M%S")
-                            time_str = dt.strftime("%Y-%m-%d %H:%M:%S")
-                        except:
-                            time_str = timestamp
-                    else:
-                        time_str = backup_path.name
-                    
-                    display_name = f"{platform} - {time_str} ({skill_count} skills)"
-                    choices.append((display_name, backup_path))
-            except:
-                # Fallback if we can't read the info file
-                choices.append((backup_path.name, backup_path))
-        else:
-            choices.append((backup_path.name, backup_path))
+    for backup_path, info in results:
+        if info is None:
+            # Fallback if we can't read the info file
+            choices.append(questionary.Choice(backup_path.name, value=(backup_path, {})))
+            continue
+        try:
+            platform = info.get("platform", "unknown")
+            timestamp = info.get("timestamp", "")
+            skill_count = len(info.get("skills", []))
+            
+            # Format timestamp for display; backups always use
+            # YYYYMMDD_HHMMSS, so slice it rather than go through strptime
+            if len(timestamp) == 15 and timestamp[8] == "_":
+                time_str = (
+                    f"{timestamp[:4]}-{timestamp[4:6]}-{timestamp[6:8]} "
+                    f"{timestamp[9:11]}:{timestamp[11:13]}:{timestamp[13:15]}"
+                )
+            elif timestamp:
+                time_str = timestamp
+            else:
+                time_str = backup_path.name
+            
+            display_name = f"{platform} - {time_str} ({skill_count} skills)"
+            choices.append(questionary.Choice(display_name, value=(backup_path, info)))
+        except (AttributeError, TypeError):
+            # Info file parsed but doesn't have the expected shape
+            choices.append(questionary.Choice(backup_path.name, value=(backup_path, {})))
     
     if not choices:
         return None
     
-    # Use inquirer list for single selection
-    questions = [
-        inquirer.List(
-            'backup',
-            message="Select backup to restore",
-            choices=choices,
-        ),
-    ]
-    
-    answers = inquirer.prompt(questions)
-    
-    if answers and 'backup' in answers:
-        return answers['backup']
-    return None
+    # Use questionary select for single selection
+    return questionary.select(
+        "Select backup to restore",
+        choices=choices,
+    ).ask()
 
 
-@app.command()
 def restore(
-    dry_run: bool = typer.Option(False, "--dry-run", help="Show what would be restored without actually restoring")
+    dry_run: bool = typer.Option(False, "--dry-run", help="Show what would be restored without actually restoring"),
+    yes: bool = typer.Option(False, "--yes", "-y", help="Skip the confirmation prompt")
 ):
     """Restore skills from a backup."""
+    from .core import list_backups, restore_skills
+
+    console = _console()
     # List all backups
     backups = list_backups()
     
@@ -450,32 +551,32 @@ def restore(
     console.print(f"\n[bold cyan]Found {len(backups)} backup(s)[/bold cyan]")
     
     # Let user select a backup
-    selected_backup = select_backup_checklist(backups)
+    selection = select_backup_checklist(backups)
     
-    if not selected_backup:
+    if not selection:
         console.print("[yellow]No backup selected.[/yellow]")
         return
     
+    # Reuse the info parsed by the picker instead of re-reading the file
+    selected_backup, backup_info = selection
     console.print(f"\n[bold cyan]Restoring from backup: {selected_backup.name}[/bold cyan]")
     
-    # Load backup info to show what will be restored
-    info_file = selected_backup / "agents_info.json"
+    # Show what will be restored
     skill_count = 0
     platform_name = "Unknown"
     
-    if info_file.exists():
-        with open(info_file, 'r') as f:
-            backup_info = json.load(f)
-            platform_key = backup_info.get("platform", "unknown")
-            skill_count = len(backup_info.get("skills", []))
-            
-            platforms = get_all_platforms()
-            if platform_key in platforms:
-                platform_name = get_platform_display_name(platforms[platform_key])
-                console.print(f"Platform: {platform_name}")
-                console.print(f"Skills: {skill_count}")
-    
-    if not dry_run:
+    if backup_info:
+        platform_key = backup_info.get("platform", "unknown")
+        skill_count = len(backup_info.get("skills", []))
+        
+        platforms = _platforms()
+        if platform_key in platforms:
+            platform_name = _display_names()[platform_key]
+            console.print(f"Platform: {platform_name}")
+            console.print(f"Skills: {skill_count}")
+    
+    if not dry_run and not yes:
+        from rich.prompt import Confirm
         if not Confirm.ask(f"Are you sure you want to restore {skill_count} skill(s) to {platform_name}?"):
             console.print("[yellow]Cancelled.[/yellow]")
             return
@@ -498,10 +599,54 @@ def restore(
         raise typer.Exit(1)
 
 
+# Command name -> callback, in the order shown by --help
+COMMANDS = {
+    "config": config,
+    "scan": scan,
+    "clean": clean,
+    "sync": sync,
+    "backup": backup,
+    "info": info,
+    "platforms": platforms,
+    "restore": restore,
+}
+
+
+def _sniff_subcommand(argv: list[str]) -> str | None:
+    """Return the subcommand named in argv, or None if there isn't a known one."""
+    for arg in argv:
+        if not arg.startswith("-"):
+            return arg if arg in COMMANDS else None
+    return None
+
+
+def build_app(command: str | None = None) -> typer.Typer:
+    """
+    Build the Typer app.
+
+    Only the given command is registered, so typer doesn't introspect the
+    signatures of commands that won't run. With no command (--help, no
+    arguments, or an unknown name) every command is registered so help
+    and error messages list them all.
+    """
+    app = typer.Typer(help="Agents Sync - Sync agent skills and MCP servers across platforms")
+
+    # An explicit callback keeps the app a command group even when only
+    # one command is registered
+    @app.callback()
+    def _root():
+        pass
+
+    names = [command] if command else list(COMMANDS)
+    for name in names:
+        app.command(name=name)(COMMANDS[name])
+    return app
+
+
 def main():
     """Entry point for the CLI."""
-    app()
+    build_app(_sniff_subcommand(sys.argv[1:]))()
 
 
 if __name__ == "__main__":
-    app()
+    main()
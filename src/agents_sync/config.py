@@ -3,7 +3,7 @@
 import json
 from pathlib import Path
 from typing import List, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 
 
 CONFIG_DIR = Path.home() / ".config" / "agents-sync"
@@ -31,25 +31,32 @@ def ensure_config_dir():
 
 def load_config() -> Config:
     """Load configuration from file."""
+    # Imported here so importing this module (e.g. for "agents --help")
+    # doesn't pull in orjson and the file helpers
+    from . import _json
+    from ._fs import cached_load
+
     ensure_config_dir()
     
-    if not CONFIG_FILE.exists():
-        return Config()
-    
     try:
-        with open(CONFIG_FILE, 'r') as f:
-            data = json.load(f)
-            return Config(**data)
-    except (json.JSONDecodeError, KeyError):
+        data = cached_load(CONFIG_FILE, _json.loads)
+        # The parse is cached and shared, so give Config its own forks list
+        # rather than one a caller could mutate behind the cache's back
+        return Config(**{**data, "forks": list(data.get("forks") or [])})
+    except (FileNotFoundError, json.JSONDecodeError, KeyError):
         return Config()
 
 
 def save_config(config: Config):
     """Save configuration to file."""
+    from . import _json
+    from ._fs import write_bytes_if_changed
+
     ensure_config_dir()
     
-    with open(CONFIG_FILE, 'w') as f:
-        json.dump(asdict(config), f, indent=2)
+    # Built directly rather than with asdict(), which deep-copies every field
+    data = {"master": config.master, "forks": config.forks}
+    write_bytes_if_changed(CONFIG_FILE, _json.dumps(data))
 
 
 def get_config_path() -> Path:
@@ -65,35 +72,37 @@ def save_agents_info(platform_key: str, info: dict):
         platform_key: The platform key
         info: Dictionary with 'skills' list and optional 'mcpServers' dict
     """
+    from . import _json
+    from ._fs import write_bytes_if_changed
+
     ensure_config_dir()
 
     # Load existing info
-    if AGENTS_INFO_FILE.exists():
-        try:
-            with open(AGENTS_INFO_FILE, 'r') as f:
-                all_info = json.load(f)
-        except (json.JSONDecodeError, KeyError):
-            all_info = {}
-    else:
+    try:
+        all_info = _json.loads(AGENTS_INFO_FILE.read_bytes())
+    except (FileNotFoundError, json.JSONDecodeError, KeyError):
         all_info = {}
 
     # Update info for this platform
     all_info[platform_key] = info
 
-    # Save back to file
-    with open(AGENTS_INFO_FILE, 'w') as f:
-        json.dump(all_info, f, indent=2)
+    # Save back to file (skipped when a rescan found nothing new)
+    write_bytes_if_changed(AGENTS_INFO_FILE, _json.dumps(all_info))
 
 
 def load_agents_info() -> dict:
-    """Load all agents information (skills and MCP servers)."""
-    ensure_config_dir()
+    """
+    Load all agents information (skills and MCP servers).
 
-    if not AGENTS_INFO_FILE.exists():
-        return {}
+    The result is cached while the file is unchanged, so treat it as
+    read-only.
+    """
+    from . import _json
+    from ._fs import cached_load
+
+    ensure_config_dir()
 
     try:
-        with open(AGENTS_INFO_FILE, 'r') as f:
-            return json.load(f)
-    except (json.JSONDecodeError, KeyError):
+        return cached_load(AGENTS_INFO_FILE, _json.loads)
+    except (FileNotFoundError, json.JSONDecodeError, KeyError):
         return {}
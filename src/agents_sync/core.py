@@ -1,14 +1,20 @@
 """Core functionality for scanning, cleaning, syncing, and backing up skills."""
 
-import shutil
-import json
+import heapq
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Set, Optional
-from datetime import datetime
+from typing import Dict, Iterator, List, Set, Optional, Tuple
 
-from .platforms import Platform, get_platform_paths, get_all_platforms
+from .platforms import CLAUDE_PLUGINS_DIR, Platform, get_platform_paths, get_all_platforms
 from .config import BACKUP_DIR, ensure_config_dir, load_agents_info, save_agents_info, AGENTS_INFO_FILE
-from .mcp import write_mcp_servers
+from .mcp import write_all_platforms
+from . import _json
+from ._fs import atomic_write_bytes, copytree, iter_named, rmtree, tree_signature
+
+
+# Skill copies are I/O-bound, so allow more threads than cores
+_COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
 
 def scan_skills(platform: Platform) -> List[Path]:
@@ -22,33 +28,40 @@ def scan_skills(platform: Platform) -> List[Path]:
     Returns:
         List of skill paths (directories containing SKILL.md)
     """
+    return [skill for skill, _ in _iter_skills(platform)]
+
+
+def _iter_skills(platform: Platform) -> Iterator[Tuple[Path, Path]]:
+    """
+    Walk the platform's skill folders, yielding each skill as it is found.
+    
+    Yields:
+        Tuples of (skill path, skill folder it was found under)
+    """
     skill_paths = get_platform_paths(platform)
-    skills = []
-    seen_skills = set()  # Track by absolute path to avoid duplicates
+    seen_skills = set()  # Track by real path string to avoid duplicates
     
     for skill_dir in skill_paths:
-        if skill_dir.exists() and skill_dir.is_dir():
+        if skill_dir.is_dir():
             # For Claude Code, search recursively for SKILL.md files
             if platform == Platform.CLAUDE_CODE:
-                for skill_md in skill_dir.rglob("SKILL.md"):
-                    skill_path = skill_md.parent
-                    abs_path = skill_path.resolve()
+                for skill_md in iter_named(skill_dir, "SKILL.md"):
+                    skill_path = os.path.dirname(skill_md)
+                    abs_path = os.path.realpath(skill_path)
                     if abs_path not in seen_skills:
-                        skills.append(skill_path)
                         seen_skills.add(abs_path)
+                        yield Path(skill_path), skill_dir
             else:
-                # For other platforms, check direct subdirectories
-                for item in skill_dir.iterdir():
-                    if item.is_dir():
-                        # Check if it contains SKILL.md or is a skill directory
-                        skill_md = item / "SKILL.md"
-                        if skill_md.exists() or item.is_dir():
-                            abs_path = item.resolve()
+                # For other platforms, every direct subdirectory is a skill
+                # (SKILL.md is not required); DirEntry.is_dir reuses the
+                # type scandir already reported instead of a stat per item
+                with os.scandir(skill_dir) as it:
+                    for entry in it:
+                        if entry.is_dir():
+                            abs_path = os.path.realpath(entry.path)
                             if abs_path not in seen_skills:
-                                skills.append(item)
                                 seen_skills.add(abs_path)
-    
-    return skills
+                                yield Path(entry.path), skill_dir
 
 
 def clean_skills(platform: Platform, dry_run: bool = False) -> int:
@@ -66,40 +79,177 @@ def clean_skills(platform: Platform, dry_run: bool = False) -> int:
     """
     skill_paths = get_platform_paths(platform)
     deleted_count = 0
-    seen_skills = set()  # Track by absolute path to avoid duplicates
+    seen_skills = set()  # Track by real path string to avoid duplicates
 
     # For Claude Code, skip plugin directories — they are managed by Claude Code
-    plugins_dir = Path.home() / ".claude" / "plugins"
+    plugins_dir = CLAUDE_PLUGINS_DIR.resolve()
 
     for skill_dir in skill_paths:
-        if skill_dir.exists() and skill_dir.is_dir():
+        if skill_dir.is_dir():
             if platform == Platform.CLAUDE_CODE:
                 # Skip plugin directories — only clean user-managed skills
-                if skill_dir.resolve().is_relative_to(plugins_dir.resolve()):
+                if skill_dir.resolve().is_relative_to(plugins_dir):
                     continue
                 # For Claude Code, recursively find all SKILL.md files and delete their parent directories
-                for skill_md in skill_dir.rglob("SKILL.md"):
-                    skill_path = skill_md.parent
-                    abs_path = skill_path.resolve()
+                # Collect before deleting so the walk never enters a removed tree
+                for skill_md in list(iter_named(skill_dir, "SKILL.md")):
+                    skill_path = os.path.dirname(skill_md)
+                    abs_path = os.path.realpath(skill_path)
                     if abs_path not in seen_skills:
-                        if not dry_run:
-                            shutil.rmtree(skill_path)
+                        if not dry_run and os.path.lexists(skill_path):
+                            rmtree(skill_path)
                         deleted_count += 1
                         seen_skills.add(abs_path)
             else:
                 # For other platforms, delete direct subdirectories
                 for item in skill_dir.iterdir():
                     if item.is_dir():
-                        abs_path = item.resolve()
+                        abs_path = os.path.realpath(item)
                         if abs_path not in seen_skills:
                             if not dry_run:
-                                shutil.rmtree(item)
+                                rmtree(item)
                             deleted_count += 1
                             seen_skills.add(abs_path)
     
     return deleted_count
 
 
+def _relative_to_master(skills: List[Path], master_paths: List[Path]) -> Dict[Path, Tuple[Path, Path]]:
+    """
+    Map each skill to (relative path, master path) for the innermost master
+    path that contains it. Skills outside every master path are omitted.
+    """
+    # Plain string prefixes (longest first) instead of relative_to, which
+    # raises ValueError for every master path a skill is not under
+    prefixes = sorted(
+        ((os.path.join(str(mp), ""), mp) for mp in master_paths),
+        key=lambda item: len(item[0]),
+        reverse=True,
+    )
+    relative_paths = {}
+    for skill in skills:
+        skill_str = os.path.join(str(skill), "")
+        for prefix, master_path in prefixes:
+            if skill_str.startswith(prefix):
+                relative_paths[skill] = (Path(skill_str[len(prefix):]), master_path)
+                break
+    return relative_paths
+
+
+def _covers(outer: Tuple[Path, Path], inner: Tuple[Path, Path]) -> bool:
+    """
+    Whether copying outer also writes everything inner would: inner's
+    destination is outer's (or inside it) and inner's source sits at the
+    same relative path inside outer's source.
+    """
+    outer_source, outer_destination = outer
+    inner_source, inner_destination = inner
+    if inner_destination != outer_destination and outer_destination not in inner_destination.parents:
+        return False
+    return inner_source == outer_source / inner_destination.relative_to(outer_destination)
+
+
+def _overlaps(first: Path, second: Path) -> bool:
+    """Whether two destination trees are the same or one contains the other."""
+    return first == second or first in second.parents or second in first.parents
+
+
+def _copy_skill_trees(jobs: List[Tuple[Path, Path]], replace: bool, skip_unchanged: bool = False) -> int:
+    """
+    Hard copy skill directory trees concurrently.
+
+    Copies are I/O-bound and the GIL is released around the syscalls, so a
+    thread pool overlaps them. Jobs whose destinations are the same or
+    nested form one group, which a single worker runs in job order, so the
+    result matches copying every job one after another: with replace the
+    last copy of a destination wins, and without it (backups) skills that
+    share a destination are merged. Different groups touch disjoint trees
+    and run in parallel.
+
+    Within a group, a job is dropped when another job's copy already writes
+    the same files from the same source tree: a later job that covers it,
+    or an earlier one with no overlapping job in between. This removes
+    repeated pairs and skills nested inside another copied skill.
+
+    Args:
+        jobs: (source skill directory, destination directory) pairs
+        replace: If True, remove an existing destination before copying;
+            otherwise merge into it
+        skip_unchanged: If True, leave a destination alone when its files
+            already match the source by relative path, size, mtime and mode
+
+    Returns:
+        Number of jobs whose destination was left alone because it was
+        unchanged (jobs dropped in favor of an unchanged copy included)
+    """
+    # Group jobs under their outermost destination. Sorting by parts puts
+    # every destination right after the ones containing it
+    group_of = {}
+    top_level = []
+    for destination in sorted({destination for _, destination in jobs}, key=lambda p: p.parts):
+        if top_level and top_level[-1] in destination.parents:
+            group_of[destination] = top_level[-1]
+        else:
+            top_level.append(destination)
+            group_of[destination] = destination
+    groups: Dict[Path, List[int]] = {destination: [] for destination in top_level}
+    for index, (_, destination) in enumerate(jobs):
+        groups[group_of[destination]].append(index)
+
+    # Job index -> index of the job whose copy makes it redundant
+    covered_by = {}
+    for indices in groups.values():
+        for position, index in enumerate(indices):
+            later = next((k for k in indices[position + 1:] if _covers(jobs[k], jobs[index])), None)
+            if later is not None:
+                covered_by[index] = later
+                continue
+            # Otherwise look back to the nearest copied job touching this
+            # tree (dropped jobs never run, so they are passed over)
+            for k in reversed(indices[:position]):
+                if k in covered_by:
+                    continue
+                if _covers(jobs[k], jobs[index]):
+                    covered_by[index] = k
+                    break
+                if _overlaps(jobs[k][1], jobs[index][1]):
+                    break
+
+    # Create parent directories up front so threads don't race on mkdir
+    for parent in {destination.parent for destination in top_level}:
+        parent.mkdir(parents=True, exist_ok=True)
+
+    def copy_one(job: Tuple[Path, Path]) -> bool:
+        source, destination = job
+        if skip_unchanged and destination.is_dir() and not destination.is_symlink():
+            signature = tree_signature(source)
+            if signature is not None and signature == tree_signature(destination):
+                return False
+        if replace and os.path.lexists(destination):
+            rmtree(destination)
+        copytree(source, destination, dirs_exist_ok=not replace)
+        return True
+
+    def copy_group(indices: List[int]) -> Dict[int, bool]:
+        return {index: copy_one(jobs[index]) for index in indices if index not in covered_by}
+
+    copied = {}
+    with ThreadPoolExecutor(max_workers=_COPY_WORKERS) as executor:
+        futures = [executor.submit(copy_group, indices) for indices in groups.values()]
+        for future in as_completed(futures):
+            copied.update(future.result())
+
+    # Count in jobs, like the caller's len(jobs): a dropped job shares the
+    # outcome of the copy that covered it
+    unchanged = 0
+    for index in range(len(jobs)):
+        while index in covered_by:
+            index = covered_by[index]
+        if not copied[index]:
+            unchanged += 1
+    return unchanged
+
+
 def sync_skills(master_platform: Platform, fork_platforms: List[Platform], master_platform_key: str, dry_run: bool = False) -> dict:
     """
     Copy skills from master to all fork platforms.
@@ -112,7 +262,9 @@ def sync_skills(master_platform: Platform, fork_platforms: List[Platform], maste
         dry_run: If True, only show what would be synced
         
     Returns:
-        Dictionary with sync results
+        Dictionary with sync results: "synced_to" and "unchanged" map each
+        fork to its number of skills copied and skills already up to date;
+        "mcp_synced_to" and "mcp_unchanged" do the same for MCP servers
     """
     # Load skills info from saved scan results
     if not AGENTS_INFO_FILE.exists():
@@ -138,17 +290,21 @@ def sync_skills(master_platform: Platform, fork_platforms: List[Platform], maste
     if not master_skills:
         return {"master_skills": 0, "synced_to": {}, "error": f"No valid skill paths found for platform '{master_platform_key}'. Run 'agents scan' first."}
     
-    # Get master skill paths (the parent directories)
-    master_paths = get_platform_paths(master_platform)
+    # Locate each skill under the master skill paths once, not once per fork
+    relative_paths = _relative_to_master(master_skills, get_platform_paths(master_platform))
     
     results = {
         "master_skills": len(master_skills),
-        "synced_to": {}
+        "synced_to": {},
+        "unchanged": {},
+        "mcp_synced_to": {},
+        "mcp_unchanged": {}
     }
     
     for fork_platform in fork_platforms:
         fork_paths = get_platform_paths(fork_platform)
         synced_count = 0
+        unchanged_count = 0
         
         # Use the first available fork path (or create it)
         if fork_paths:
@@ -156,34 +312,28 @@ def sync_skills(master_platform: Platform, fork_platforms: List[Platform], maste
             fork_dir.mkdir(parents=True, exist_ok=True)
             
             # Copy each skill from master to fork (overwrites existing)
-            for master_skill in master_skills:
-                # Determine relative path from master skill directory
-                relative_path = None
-                for master_path in master_paths:
-                    try:
-                        relative_path = master_skill.relative_to(master_path)
-                        break
-                    except ValueError:
-                        continue
-                
-                if relative_path:
-                    fork_skill_path = fork_dir / relative_path
-                    
-                    if not dry_run:
-                        # Remove existing skill if it exists, then copy
-                        if fork_skill_path.exists():
-                            shutil.rmtree(fork_skill_path)
-                        # Hard copy the entire directory tree
-                        shutil.copytree(master_skill, fork_skill_path)
-                    synced_count += 1
+            jobs = [
+                (master_skill, fork_dir / relative_paths[master_skill][0])
+                for master_skill in master_skills
+                if master_skill in relative_paths
+            ]
+            
+            if not dry_run:
+                unchanged_count = _copy_skill_trees(jobs, replace=True, skip_unchanged=True)
+            # Only skills that were (or would be) copied count as synced
+            synced_count = len(jobs) - unchanged_count
         
         results["synced_to"][fork_platform.value] = synced_count
+        results["unchanged"][fork_platform.value] = unchanged_count
 
     # Sync MCP servers
-    if master_mcp_servers:
-        for fork_platform in fork_platforms:
-            if not dry_run:
-                write_mcp_servers(fork_platform, master_mcp_servers)
+    if master_mcp_servers and not dry_run:
+        written = write_all_platforms({fork_platform: master_mcp_servers for fork_platform in fork_platforms})
+        for fork_platform, counts in written.items():
+            # Forks whose config could not be written report nothing
+            if counts is not None:
+                results["mcp_synced_to"][fork_platform.value] = counts[0]
+                results["mcp_unchanged"][fork_platform.value] = counts[1]
 
     results["mcp_synced"] = len(master_mcp_servers)
 
@@ -202,6 +352,8 @@ def backup_skills(platform: Platform, dry_run: bool = False) -> Path:
     Returns:
         Path to the backup directory
     """
+    from datetime import datetime
+
     ensure_config_dir()
     
     # Create timestamped backup directory
@@ -211,64 +363,41 @@ def backup_skills(platform: Platform, dry_run: bool = False) -> Path:
     if not dry_run:
         backup_path.mkdir(parents=True, exist_ok=True)
     
-    master_skills = scan_skills(platform)
-    master_paths = get_platform_paths(platform)
-    
-    # Prepare skills info for backup
+    # Prepare skills info and copy jobs while scanning; the scan already
+    # knows which skill folder each skill lives under
     skills_info = []
-    for skill in master_skills:
-        # Determine relative path from master skill directory
-        relative_path = None
-        for master_path in master_paths:
-            try:
-                relative_path = skill.relative_to(master_path)
-                break
-            except ValueError:
-                continue
-        
-        if relative_path:
-            skills_info.append({
-                "name": skill.name,
-                "path": str(skill),
-                "relative_path": str(relative_path),
-                "master_path": str(master_path)
-            })
+    jobs = []
+    for skill, master_path in _iter_skills(platform):
+        relative_path = skill.relative_to(master_path)
+        skills_info.append({
+            "name": skill.name,
+            "path": str(skill),
+            "relative_path": str(relative_path),
+            "master_path": str(master_path)
+        })
+        jobs.append((skill, backup_path / relative_path))
     
     if not dry_run:
-        # Save agents_info.json to backup directory
-        backup_info_file = backup_path / "agents_info.json"
-        with open(backup_info_file, 'w') as f:
-            json.dump({
-                "platform": platform.value,
-                "timestamp": timestamp,
-                "skills": skills_info
-            }, f, indent=2)
-        
         # Copy skills
-        for master_skill in master_skills:
-            # Determine relative path from master skill directory
-            relative_path = None
-            for master_path in master_paths:
-                try:
-                    relative_path = master_skill.relative_to(master_path)
-                    break
-                except ValueError:
-                    continue
-            
-            if relative_path:
-                backup_skill_path = backup_path / relative_path
-                # Hard copy the entire directory tree
-                shutil.copytree(master_skill, backup_skill_path, dirs_exist_ok=True)
+        _copy_skill_trees(jobs, replace=False)
+        
+        # Save agents_info.json last, so only complete backups are listed
+        atomic_write_bytes(backup_path / "agents_info.json", _json.dumps({
+            "platform": platform.value,
+            "timestamp": timestamp,
+            "skills": skills_info
+        }))
     
     return backup_path
 
 
-def list_backups(platform: Optional[Platform] = None) -> List[Path]:
+def list_backups(platform: Optional[Platform] = None, limit: Optional[int] = None) -> List[Path]:
     """
     List all available backup directories.
     
     Args:
         platform: Optional platform to filter backups by
+        limit: Optional maximum number of (newest) backups to return
         
     Returns:
         List of backup directory paths, sorted by creation time (newest first)
@@ -278,23 +407,25 @@ def list_backups(platform: Optional[Platform] = None) -> List[Path]:
     if not BACKUP_DIR.exists():
         return []
     
+    # One scandir pass; DirEntry caches the stat used for sorting
     backups = []
-    for backup_path in BACKUP_DIR.iterdir():
-        if backup_path.is_dir():
+    with os.scandir(BACKUP_DIR) as it:
+        for entry in it:
+            if not entry.is_dir():
+                continue
+            # Filter by platform if specified
+            if platform and entry.name.split('_')[0] != platform.value:
+                continue
             # Check if it's a valid backup (has agents_info.json)
-            info_file = backup_path / "agents_info.json"
-            if info_file.exists():
-                # Filter by platform if specified
-                if platform:
-                    backup_platform = backup_path.name.split('_')[0]
-                    if backup_platform == platform.value:
-                        backups.append(backup_path)
-                else:
-                    backups.append(backup_path)
+            if os.path.isfile(os.path.join(entry.path, "agents_info.json")):
+                backups.append((entry.stat().st_mtime, entry.path))
     
     # Sort by modification time (newest first)
-    backups.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-    return backups
+    if limit is not None:
+        newest = heapq.nlargest(limit, backups, key=lambda b: b[0])
+    else:
+        newest = sorted(backups, key=lambda b: b[0], reverse=True)
+    return [Path(path) for _, path in newest]
 
 
 def restore_skills(backup_path: Path, dry_run: bool = False) -> dict:
@@ -315,8 +446,7 @@ def restore_skills(backup_path: Path, dry_run: bool = False) -> dict:
         raise ValueError(f"Backup directory {backup_path} does not contain agents_info.json")
     
     # Load backup info
-    with open(info_file, 'r') as f:
-        backup_info = json.load(f)
+    backup_info = _json.loads(info_file.read_bytes())
     
     platform_key = backup_info.get("platform")
     skills_info = backup_info.get("skills", [])
@@ -332,8 +462,17 @@ def restore_skills(backup_path: Path, dry_run: bool = False) -> dict:
     platform = all_platforms[platform_key]
     platform_paths = get_platform_paths(platform)
     
+    # Resolve the platform paths once, not once per backed-up skill; the
+    # first path wins when several resolve to the same place
+    resolved_map = {}
+    for mp in platform_paths:
+        resolved_map.setdefault(str(mp.expanduser().resolve()), mp)
+    # First plugins path, for backups whose original plugin path moved
+    plugins_path = next((mp for mp in platform_paths if 'plugins' in str(mp)), None)
+    
     restored_count = 0
     errors = []
+    created_dirs = set()
     
     for skill_info in skills_info:
             skill_name = skill_info.get("name")
@@ -348,12 +487,8 @@ def restore_skills(backup_path: Path, dry_run: bool = False) -> dict:
             master_path = None
             
             # First, try exact match (resolve paths to handle ~ expansion)
-            master_path_resolved = Path(master_path_str).expanduser().resolve() if master_path_str else None
-            for mp in platform_paths:
-                mp_resolved = mp.expanduser().resolve()
-                if mp_resolved == master_path_resolved:
-                    master_path = mp
-                    break
+            if master_path_str:
+                master_path = resolved_map.get(str(Path(master_path_str).expanduser().resolve()))
             
             # If no exact match, try to find a path with similar structure
             if not master_path and master_path_str:
@@ -361,11 +496,8 @@ def restore_skills(backup_path: Path, dry_run: bool = False) -> dict:
                 if platform == Platform.CLAUDE_CODE:
                     # Check if the original path was under plugins
                     if 'plugins' in master_path_str:
-                        # Find any plugins path
-                        for mp in platform_paths:
-                            if 'plugins' in str(mp):
-                                master_path = mp
-                                break
+                        # Use any plugins path
+                        master_path = plugins_path
                 
                 # If still no match, use the first available path
                 # This works for non-plugin paths where structure is consistent
@@ -389,19 +521,21 @@ def restore_skills(backup_path: Path, dry_run: bool = False) -> dict:
             if dry_run:
                 restored_count += 1
             else:
-                # Ensure master path exists
-                master_path.mkdir(parents=True, exist_ok=True)
+                # Ensure master path exists (once per master path)
+                if master_path not in created_dirs:
+                    master_path.mkdir(parents=True, exist_ok=True)
+                    created_dirs.add(master_path)
                 
                 # Restore skill
                 restore_skill_path = master_path / relative_path_str
                 
                 try:
                     # Remove existing skill if it exists
-                    if restore_skill_path.exists():
-                        shutil.rmtree(restore_skill_path)
+                    if os.path.lexists(restore_skill_path):
+                        rmtree(restore_skill_path)
                     
                     # Copy skill from backup
-                    shutil.copytree(backup_skill_path, restore_skill_path)
+                    copytree(backup_skill_path, restore_skill_path)
                     restored_count += 1
                 except Exception as e:
                     errors.append(f"Skill {skill_name}: Failed to restore - {str(e)}")
@@ -2,411 +2,421 @@
 
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, Any, List, Tuple
-
-# TOML imports with Python version compatibility
-if sys.version_info >= (3, 11):
-    import tomllib
-else:
-    import tomli as tomllib
-import tomli_w
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
 
+from . import _json
+from ._converters import codex_to_claude, opencode_to_claude, servers_to_codex, servers_to_opencode
+from ._fs import atomic_write_bytes, cached_load, iter_named, read_mapped
 from .platforms import Platform, get_mcp_paths
 
 
-def read_mcp_servers(platform: Platform) -> Tuple[Dict[str, Any], List[str]]:
+# Where a server was read from: (server name, origin), e.g.
+# ("github", "~/.claude.json"). Format for display with format_source
+MCPSource = Tuple[str, str]
+
+# Outcome of writing servers to one platform: (servers written, servers
+# already up to date), both counted in the platform's own format
+MCPWriteCounts = Tuple[int, int]
+
+
+# Platforms whose global config is plain JSON with a Claude-style
+# "mcpServers" object, so they share one reader and writer
+_JSON_MCPSERVERS_PLATFORMS = frozenset({Platform.CURSOR, Platform.GEMINI})
+
+
+@lru_cache(maxsize=1)
+def _get_toml():
+    """
+    Import the TOML reader and writer on first use, since only Codex needs them.
+
+    TOMLDecodeError subclasses ValueError, so callers catch ValueError
+    rather than importing the module just to name the exception.
+
+    Returns:
+        Tuple of (TOML reader module, tomli_w module)
+    """
+    # TOML imports with Python version compatibility. Codex's config is
+    # parsed, edited and written back, so the parser must keep key order
+    # and reject duplicate keys; tomllib/tomli do both
+    if sys.version_info >= (3, 11):
+        import tomllib
+    else:
+        import tomli as tomllib
+    import tomli_w
+
+    return tomllib, tomli_w
+
+
+def read_mcp_servers(
+    platform: Platform, collect_sources: bool = True
+) -> Tuple[Dict[str, Any], List[MCPSource]]:
     """
     Read MCP servers from any platform's configuration.
     Returns servers in Claude format (canonical internal format).
 
+    Args:
+        platform: Platform to read
+        collect_sources: If False, skip building the sources list (it is
+            returned empty), for callers that only need the servers
+
     Returns:
-        Tuple of (mcpServers dict in Claude format, list of source descriptions)
+        Tuple of (mcpServers dict in Claude format, list of (name, origin) sources)
     """
-    if platform == Platform.CLAUDE_CODE:
-        return _read_claude_mcp()
-    elif platform == Platform.CODEX:
-        return _read_codex_mcp()
-    elif platform == Platform.OPENCODE:
-        return _read_opencode_mcp()
-    elif platform in (Platform.CURSOR, Platform.GEMINI):
-        return _read_json_mcpservers(platform)
-    return {}, []
-
-
-def _read_claude_mcp() -> Tuple[Dict[str, Any], List[str]]:
+    reader = _READERS.get(platform)
+    if reader is None:
+        return {}, []
+    return reader(collect_sources=collect_sources)
+
+
+def format_source(source: MCPSource) -> str:
+    """Describe a server source for display, e.g. "github (from ~/.claude.json)"."""
+    name, origin = source
+    return f"{name} (from {origin})"
+
+
+def _read_claude_mcp(collect_sources: bool = True) -> Tuple[Dict[str, Any], List[MCPSource]]:
     """Read MCP servers from Claude Code configuration."""
     mcp_paths = get_mcp_paths(Platform.CLAUDE_CODE)
-    servers = {}
-    sources = []
 
     # Read global config
-    global_path = mcp_paths.get("global")
-    if global_path and global_path.exists():
-        try:
-            with open(global_path, 'r') as f:
-                data = json.load(f)
-                global_servers = data.get("mcpServers", {})
-                for name, config in global_servers.items():
-                    servers[name] = config
-                    sources.append(f"{name} (from ~/.claude.json)")
-        except (json.JSONDecodeError, IOError):
-            pass
+    servers, sources = _read_global_mcp(Platform.CLAUDE_CODE, collect_sources)
 
-    # Read plugin configs from installed plugins
+    # Read plugin configs from installed plugins. Each read is a small,
+    # latency-bound file open, so they run in threads; results are merged
+    # here in plugin order so precedence doesn't depend on timing
     plugin_paths = mcp_paths.get("plugins", [])
-    for plugin_path in plugin_paths:
-        if not plugin_path.exists():
-            continue
-        for mcp_json in plugin_path.rglob(".mcp.json"):
-            try:
-                with open(mcp_json, 'r') as f:
-                    data = json.load(f)
-                    plugin_name = mcp_json.parent.name
-                    # Some plugins wrap configs in "mcpServers" (e.g. Stripe)
-                    if "mcpServers" in data and isinstance(data["mcpServers"], dict):
-                        entries = data["mcpServers"]
-                    else:
-                        entries = data
-                    for name, config in entries.items():
-                        if isinstance(config, dict) and name not in servers:
-                            servers[name] = config
-                            sources.append(f"{name} (from {plugin_name} plugin)")
-            except (json.JSONDecodeError, IOError):
-                pass
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        plugin_configs = list(executor.map(_load_plugin_mcp, plugin_paths))
+
+    for configs in plugin_configs:
+        for plugin_name, entries in configs:
+            # Earlier sources win, so only add names not seen yet
+            plugin_servers = {
+                name: config for name, config in entries.items()
+                if isinstance(config, dict) and name not in servers
+            }
+            servers.update(plugin_servers)
+            if collect_sources:
+                origin = f"{plugin_name} plugin"
+                sources.extend((name, origin) for name in plugin_servers)
 
     return servers, sources
 
 
-def _read_json_mcpservers(platform: Platform) -> Tuple[Dict[str, Any], List[str]]:
-    """Read MCP servers from JSON config with mcpServers key (Cursor, Gemini)."""
-    mcp_paths = get_mcp_paths(platform)
-    global_path = mcp_paths.get("global")
-    servers = {}
-    sources = []
+def _load_plugin_mcp(plugin_path: Path) -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    Load an installed plugin's MCP server entries.
 
-    if global_path and global_path.exists():
+    Returns:
+        List of (plugin name, server entries) per readable .mcp.json file
+    """
+    configs = []
+    for mcp_json in _plugin_mcp_jsons(plugin_path):
         try:
-            with open(global_path, 'r') as f:
-                data = json.load(f)
-                for name, config in data.get("mcpServers", {}).items():
-                    servers[name] = config
-                    sources.append(f"{name} (from {global_path.name})")
+            data = _json.loads(mcp_json.read_bytes())
         except (json.JSONDecodeError, IOError):
-            pass
+            continue
+        # Some plugins wrap configs in "mcpServers" (e.g. Stripe)
+        if "mcpServers" in data and isinstance(data["mcpServers"], dict):
+            entries = data["mcpServers"]
+        else:
+            entries = data
+        configs.append((mcp_json.parent.name, entries))
+    return configs
 
-    return servers, sources
 
+def _plugin_mcp_jsons(plugin_path: Path) -> List[Path]:
+    """
+    Find .mcp.json files in an installed plugin.
+
+    Plugins keep .mcp.json at their root, so that is checked first; the
+    whole plugin tree is only searched when the root has none.
+    """
+    root_mcp_json = plugin_path / ".mcp.json"
+    if root_mcp_json.is_file():
+        return [root_mcp_json]
+    return [Path(path) for path in iter_named(plugin_path, ".mcp.json")]
 
-def _read_codex_mcp() -> Tuple[Dict[str, Any], List[str]]:
-    """Read MCP servers from Codex config.toml and convert to Claude format."""
-    mcp_paths = get_mcp_paths(Platform.CODEX)
-    global_path = mcp_paths.get("global")
+
+def _read_global_mcp(
+    platform: Platform, collect_sources: bool = True
+) -> Tuple[Dict[str, Any], List[MCPSource]]:
+    """
+    Read MCP servers from a platform's global config and convert them to
+    Claude format, as described by the platform's _SPEC entry.
+    """
+    global_path = get_mcp_paths(platform).get("global")
     servers = {}
     sources = []
 
-    if global_path and global_path.exists():
-        try:
-            with open(global_path, 'rb') as f:
-                data = tomllib.load(f)
-                for name, config in data.get("mcp_servers", {}).items():
-                    # Convert Codex format to Claude format
-                    claude_config = {}
-                    if "url" in config:
-                        # Remote/streamable HTTP server
-                        claude_config["type"] = "http"
-                        claude_config["url"] = config["url"]
-                        if "http_headers" in config:
-                            claude_config["headers"] = config["http_headers"]
-                    else:
-                        # Stdio server
-                        if "command" in config:
-                            claude_config["command"] = config["command"]
-                        if "args" in config:
-                            claude_config["args"] = config["args"]
-                        if "env" in config:
-                            claude_config["env"] = config["env"]
-                    if claude_config:
-                        servers[name] = claude_config
-                        sources.append(f"{name} (from config.toml)")
-        except (tomllib.TOMLDecodeError, IOError):
-            pass
+    if not global_path:
+        return servers, sources
+
+    spec = _SPEC[platform]
+    origin = spec.origin or global_path.name
+    # A missing file is caught as IOError below, so no exists() check first
+    try:
+        entries = cached_load(global_path, _SECTION_LOADERS[platform])
+    except (ValueError, IOError):
+        return servers, sources
+
+    for name, config in entries.items():
+        claude_config = spec.to_claude(config)
+        if claude_config is not None:
+            servers[name] = claude_config
+    if collect_sources:
+        sources = [(name, origin) for name in servers]
 
     return servers, sources
 
 
-def _read_opencode_mcp() -> Tuple[Dict[str, Any], List[str]]:
-    """Read MCP servers from OpenCode config and convert to Claude format."""
-    mcp_paths = get_mcp_paths(Platform.OPENCODE)
-    global_path = mcp_paths.get("global")
-    servers = {}
-    sources = []
+def _same_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a config (or servers) already in Claude format unchanged."""
+    return config
 
-    if global_path and global_path.exists():
-        try:
-            with open(global_path, 'r') as f:
-                data = json.load(f)
-                for name, config in data.get("mcp", {}).items():
-                    # Convert OpenCode format to Claude format
-                    server_type = config.get("type", "local")
-                    if server_type == "local":
-                        command_list = config.get("command", [])
-                        claude_config = {
-                            "command": command_list[0] if command_list else "",
-                            "args": command_list[1:] if len(command_list) > 1 else [],
-                        }
-                        if "environment" in config:
-                            claude_config["env"] = config["environment"]
-                    else:  # remote
-                        claude_config = {
-                            "type": "http",
-                            "url": config.get("url", ""),
-                        }
-                        if "headers" in config:
-                            claude_config["headers"] = config["headers"]
-                    servers[name] = claude_config
-                    sources.append(f"{name} (from opencode.json)")
-        except (json.JSONDecodeError, IOError):
-            pass
 
-    return servers, sources
+# Reader for each platform's MCP config, in Claude format
+_READERS = {
+    Platform.CLAUDE_CODE: _read_claude_mcp,
+    **{platform: partial(_read_global_mcp, platform) for platform in Platform if platform != Platform.CLAUDE_CODE},
+}
 
 
 # Keep old name for backward compatibility within this file
 def read_claude_mcp_servers() -> Tuple[Dict[str, Any], List[str]]:
     """Deprecated: Use read_mcp_servers(Platform.CLAUDE_CODE) instead."""
-    return _read_claude_mcp()
+    servers, sources = _read_claude_mcp()
+    # Sources were display strings before they became (name, origin) pairs
+    return servers, [format_source(source) for source in sources]
 
 
 def write_mcp_servers(platform: Platform, servers: Dict[str, Any], dry_run: bool = False) -> bool:
     """
     Write MCP servers to a platform's config file.
-    Translates from Claude format to target format.
+    Translates from Claude format to target format. The file is left
+    untouched when it already holds exactly these servers.
+
+    This is the batched entry point: servers replaces the platform's whole
+    MCP section in one read and one write of the config, so pass every
+    server at once rather than calling this once per server.
 
     Returns:
         True if successful
     """
+    return _write_servers(platform, servers, dry_run) is not None
+
+
+def _write_servers(platform: Platform, servers: Dict[str, Any], dry_run: bool = False) -> Optional[MCPWriteCounts]:
+    """
+    Write MCP servers to a platform's config file, as write_mcp_servers.
+
+    Returns:
+        (written, already up to date) server counts, or None if the
+        config could not be written
+    """
     mcp_paths = get_mcp_paths(platform)
     global_path = mcp_paths.get("global")
 
     if not global_path:
-        return False
+        return None
 
+    section = _SPEC[platform].from_claude(servers)
     if dry_run:
-        return True
+        return len(section), 0
 
     # Ensure parent directory exists
     global_path.parent.mkdir(parents=True, exist_ok=True)
 
     try:
-        if platform == Platform.CLAUDE_CODE:
-            _write_claude_mcp(global_path, servers)
-        elif platform == Platform.CODEX:
-            _write_codex_mcp(global_path, servers)
-        elif platform == Platform.OPENCODE:
-            _write_opencode_mcp(global_path, servers)
-        elif platform in (Platform.CURSOR, Platform.GEMINI):
-            _write_json_mcpservers(global_path, servers)
-        return True
+        unchanged = _write_section(platform, global_path, section)
     except IOError:
-        return False
+        return None
+    return len(section) - unchanged, unchanged
 
 
-def _write_claude_mcp(path: Path, servers: Dict[str, Any]):
-    """Write MCP servers to Claude config."""
-    data = {}
-    if path.exists():
-        try:
-            with open(path, 'r') as f:
-                data = json.load(f)
-        except json.JSONDecodeError:
-            pass
-
-    data["mcpServers"] = servers
-    with open(path, 'w') as f:
-        json.dump(data, f, indent=2)
-
+def read_all_platforms(
+    platforms: Optional[List[Platform]] = None, collect_sources: bool = True
+) -> Dict[Platform, Tuple[Dict[str, Any], List[MCPSource]]]:
+    """
+    Read MCP servers from several platforms at once.
+    Each platform's config is independent file I/O, so they are read in threads.
 
-def _write_codex_mcp(path: Path, servers: Dict[str, Any]):
-    """Write MCP servers to Codex config.toml."""
-    data = {}
-    if path.exists():
-        try:
-            with open(path, 'rb') as f:
-                data = tomllib.load(f)
-        except tomllib.TOMLDecodeError:
-            pass
-
-    # Convert Claude format to Codex format
-    codex_servers = {}
-    for name, config in servers.items():
-        server_type = config.get("type", "stdio")
-        codex_config = {}
-        if server_type in ("sse", "http"):
-            # Remote server: map url and headers
-            if "url" in config:
-                codex_config["url"] = config["url"]
-            if "headers" in config:
-                codex_config["http_headers"] = config["headers"]
-        else:
-            # Stdio server: map command, args, env
-            if "command" in config:
-                codex_config["command"] = config["command"]
-            if "args" in config:
-                codex_config["args"] = config["args"]
-            if "env" in config:
-                codex_config["env"] = config["env"]
-        # Skip servers with no usable config (avoids empty TOML sections)
-        if codex_config:
-            codex_servers[name] = codex_config
-
-    data["mcp_servers"] = codex_servers
-    with open(path, 'wb') as f:
-        tomli_w.dump(data, f)
-
-
-def _write_opencode_mcp(path: Path, servers: Dict[str, Any]):
-    """Write MCP servers to OpenCode config."""
-    data = {}
-    if path.exists():
-        try:
-            with open(path, 'r') as f:
-                data = json.load(f)
-        except json.JSONDecodeError:
-            pass
-
-    # Convert Claude format to OpenCode format
-    opencode_servers = {}
-    for name, config in servers.items():
-        server_type = config.get("type", "stdio")
-        if server_type == "stdio":
-            command_list = [config.get("command", "")]
-            if "args" in config:
-                command_list.extend(config["args"])
-            opencode_config = {
-                "type": "local",
-                "command": command_list,
-                "enabled": True,
-            }
-            if "env" in config:
-                opencode_config["environment"] = config["env"]
-        else:  # http
-            opencode_config = {
-                "type": "remote",
-                "url": config.get("url", ""),
-                "enabled": True,
-            }
-            if "headers" in config:
-                opencode_config["headers"] = config["headers"]
-        opencode_servers[name] = opencode_config
+    Args:
+        platforms: Platforms to read (defaults to every platform)
+        collect_sources: Passed on to read_mcp_servers
 
-    data["mcp"] = opencode_servers
-    with open(path, 'w') as f:
-        json.dump(data, f, indent=2)
+    Returns:
+        Dictionary mapping each platform to read_mcp_servers' result
+    """
+    platforms = list(Platform) if platforms is None else platforms
+    if not platforms:
+        return {}
+    with ThreadPoolExecutor(max_workers=len(platforms)) as executor:
+        read = partial(read_mcp_servers, collect_sources=collect_sources)
+        return dict(zip(platforms, executor.map(read, platforms)))
 
 
-def _write_json_mcpservers(path: Path, servers: Dict[str, Any]):
-    """Write MCP servers to JSON config with mcpServers key (Cursor, Gemini)."""
-    data = {}
-    if path.exists():
-        try:
-            with open(path, 'r') as f:
-                data = json.load(f)
-        except json.JSONDecodeError:
-            pass
+def write_all_platforms(
+    servers_by_platform: Dict[Platform, Dict[str, Any]], dry_run: bool = False
+) -> Dict[Platform, Optional[MCPWriteCounts]]:
+    """
+    Write MCP servers to several platforms at once, one thread per platform.
 
-    data["mcpServers"] = servers
-    with open(path, 'w') as f:
-        json.dump(data, f, indent=2)
+    Args:
+        servers_by_platform: Servers (Claude format) to write for each platform
+        dry_run: If True, only report what would be written
 
+    Returns:
+        Dictionary mapping each platform to its (written, already up to
+        date) server counts, or None where the config could not be written
+    """
+    if not servers_by_platform:
+        return {}
+    with ThreadPoolExecutor(max_workers=len(servers_by_platform)) as executor:
+        futures = {
+            platform: executor.submit(_write_servers, platform, servers, dry_run)
+            for platform, servers in servers_by_platform.items()
+        }
+        return {platform: future.result() for platform, future in futures.items()}
 
-def _count_mcp_servers(platform: Platform) -> int:
-    """Count MCP servers in a platform's config (for clean reporting)."""
-    mcp_paths = get_mcp_paths(platform)
-    global_path = mcp_paths.get("global")
 
-    if not global_path or not global_path.exists():
-        return 0
+def _write_section(platform: Platform, path: Path, section: Dict[str, Any]) -> int:
+    """
+    Replace the MCP section of a platform's config file in one read and at
+    most one write. Unrelated keys are kept, and nothing is written when the
+    file already holds exactly this section.
 
+    Returns:
+        Number of servers in section that the file already held unchanged
+    """
+    spec = _SPEC[platform]
+    data = {}
     try:
-        if platform == Platform.CLAUDE_CODE:
-            # Only count global servers (plugins are not cleaned)
-            with open(global_path, 'r') as f:
-                data = json.load(f)
-            return len(data.get("mcpServers", {}))
-        elif platform == Platform.CODEX:
-            with open(global_path, 'rb') as f:
-                data = tomllib.load(f)
-            return len(data.get("mcp_servers", {}))
-        elif platform == Platform.OPENCODE:
-            with open(global_path, 'r') as f:
-                data = json.load(f)
-            return len(data.get("mcp", {}))
-        elif platform in (Platform.CURSOR, Platform.GEMINI):
-            with open(global_path, 'r') as f:
-                data = json.load(f)
-            return len(data.get("mcpServers", {}))
-    except (json.JSONDecodeError, IOError, tomllib.TOMLDecodeError):
+        with read_mapped(path) as raw:
+            data = spec.loads(raw)
+    except (FileNotFoundError, ValueError):
         pass
 
-    return 0
+    existing = data.get(spec.key)
+    if not isinstance(existing, dict):
+        existing = {}
+    unchanged = sum(1 for name, config in section.items() if existing.get(name) == config)
+
+    if data.get(spec.key) == section:
+        return unchanged
+    data[spec.key] = section
+    atomic_write_bytes(path, spec.dumps(data))
+    return unchanged
+
+
+def _load_toml(raw) -> Dict[str, Any]:
+    """Parse TOML from bytes or a buffer such as an mmap."""
+    tomllib, _ = _get_toml()
+    return tomllib.loads(str(raw, "utf-8"))
+
+
+def _dump_toml(data: Dict[str, Any]) -> bytes:
+    """Serialize data to TOML bytes."""
+    _, tomli_w = _get_toml()
+    return tomli_w.dumps(data).encode("utf-8")
+
+
+class _ConfigSpec(NamedTuple):
+    """How a platform's global config is laid out."""
+    key: str  # MCP section key
+    loads: Callable[[Any], Dict[str, Any]]  # parse bytes (or an mmap)
+    dumps: Callable[[Dict[str, Any]], bytes]  # serialize back to bytes
+    to_claude: Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]  # one server
+    from_claude: Callable[[Dict[str, Any]], Dict[str, Any]]  # all servers
+    origin: Optional[str]  # source origin, or None for the file name
+
+
+# Config layout for each platform, used by the global reader,
+# _write_section and clean_mcp_servers
+_SPEC = {
+    Platform.CLAUDE_CODE: _ConfigSpec(
+        key="mcpServers", loads=_json.loads, dumps=_json.dumps,
+        to_claude=_same_config, from_claude=_same_config, origin="~/.claude.json",
+    ),
+    Platform.CODEX: _ConfigSpec(
+        key="mcp_servers", loads=_load_toml, dumps=_dump_toml,
+        to_claude=codex_to_claude, from_claude=servers_to_codex, origin=None,
+    ),
+    Platform.OPENCODE: _ConfigSpec(
+        key="mcp", loads=_json.loads, dumps=_json.dumps,
+        to_claude=opencode_to_claude, from_claude=servers_to_opencode, origin=None,
+    ),
+    **dict.fromkeys(
+        _JSON_MCPSERVERS_PLATFORMS,
+        _ConfigSpec(
+            key="mcpServers", loads=_json.loads, dumps=_json.dumps,
+            to_claude=_same_config, from_claude=_same_config, origin=None,
+        ),
+    ),
+}
+
+
+def _load_section(key: str, loads, raw) -> Dict[str, Any]:
+    """Parse a config's MCP section, or {} when the key never appears."""
+    # Configs like ~/.claude.json also hold unrelated (often large) state,
+    # so only parse files that can contain the section at all
+    if raw.find(key.encode()) == -1:
+        return {}
+    if loads is _json.loads:
+        # JSON configs can skip building the rest of the document
+        return _json.load_key(raw, key)
+    return loads(raw).get(key, {})
+
+
+# cached_load loaders for each platform's MCP section. They are built once
+# here because cached_load keys its cache on the loader
+_SECTION_LOADERS = {
+    platform: partial(_load_section, spec.key, spec.loads) for platform, spec in _SPEC.items()
+}
 
 
 def clean_mcp_servers(platform: Platform, dry_run: bool = False) -> int:
     """
     Remove MCP servers from a platform's config.
+    The config is read and parsed once, for both the count and the edit;
+    a dry run reuses a cached parse when the file hasn't changed.
 
     Returns:
         Number of servers removed
     """
     mcp_paths = get_mcp_paths(platform)
-    removed_count = _count_mcp_servers(platform)
+    global_path = mcp_paths.get("global")
 
-    if dry_run or removed_count == 0:
-        return removed_count
+    if not global_path:
+        return 0
 
-    global_path = mcp_paths.get("global")
+    spec = _SPEC[platform]
 
+    # Claude Code: clean global config only — plugin .mcp.json files are
+    # managed by Claude Code and should not be mutated
     try:
-        if platform == Platform.CLAUDE_CODE:
-            # Clean global config only — plugin .mcp.json files are
-            # managed by Claude Code and should not be mutated
-            if global_path and global_path.exists():
-                with open(global_path, 'r') as f:
-                    data = json.load(f)
-                if "mcpServers" in data:
-                    del data["mcpServers"]
-                    with open(global_path, 'w') as f:
-                        json.dump(data, f, indent=2)
-
-        elif platform == Platform.CODEX:
-            if global_path and global_path.exists():
-                with open(global_path, 'rb') as f:
-                    data = tomllib.load(f)
-                if "mcp_servers" in data:
-                    del data["mcp_servers"]
-                    with open(global_path, 'wb') as f:
-                        tomli_w.dump(data, f)
-
-        elif platform == Platform.OPENCODE:
-            if global_path and global_path.exists():
-                with open(global_path, 'r') as f:
-                    data = json.load(f)
-                if "mcp" in data:
-                    del data["mcp"]
-                    with open(global_path, 'w') as f:
-                        json.dump(data, f, indent=2)
-
-        elif platform in (Platform.CURSOR, Platform.GEMINI):
-            if global_path and global_path.exists():
-                with open(global_path, 'r') as f:
-                    data = json.load(f)
-                if "mcpServers" in data:
-                    del data["mcpServers"]
-                    with open(global_path, 'w') as f:
-                        json.dump(data, f, indent=2)
-
-    except (json.JSONDecodeError, IOError, tomllib.TOMLDecodeError):
+        # A dry run only counts, so it can share the readers' cached parse
+        if dry_run:
+            return len(cached_load(global_path, _SECTION_LOADERS[platform]))
+        with read_mapped(global_path) as raw:
+            # Nothing to count or clean if the key never appears
+            if raw.find(spec.key.encode()) == -1:
+                return 0
+            data = spec.loads(raw)
+    except (ValueError, IOError):
+        return 0
+
+    removed_count = len(data.get(spec.key, {}))
+    if removed_count == 0:
+        return removed_count
+
+    del data[spec.key]
+    try:
+        atomic_write_bytes(global_path, spec.dumps(data))
+    except IOError:
         pass
 
     return removed_count
@@ -1,13 +1,18 @@
 """Platform definitions and path management."""
 
 import json
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
 from enum import Enum
 
+from . import _json
+from ._fs import iter_named
 
-class Platform(Enum):
-    """Supported platforms."""
+
+class Platform(str, Enum):
+    """Supported platforms (members compare and hash as their string values)."""
     CLAUDE_CODE = "claude-code"
     OPENCODE = "opencode"
     CODEX = "codex"
@@ -15,6 +20,42 @@ class Platform(Enum):
     GEMINI = "gemini"
 
 
+# Resolved once; every platform path below is rooted here
+_HOME = Path.home()
+
+# Claude Code keeps installed plugins (and their skills/MCP configs) here
+CLAUDE_PLUGINS_DIR = _HOME / ".claude" / "plugins"
+
+# Static skill directories for each platform. Claude Code adds its
+# discovered plugin paths on top of these (see _platform_paths)
+_SKILL_PATHS: Dict[Platform, List[Path]] = {
+    Platform.CLAUDE_CODE: [_HOME / ".claude" / "skills"],
+    Platform.OPENCODE: [_HOME / ".opencode" / "skill"],
+    Platform.CODEX: [_HOME / ".codex" / "skills"],
+    Platform.CURSOR: [_HOME / ".cursor" / "skills"],
+    Platform.GEMINI: [_HOME / ".gemini" / "skills"],
+}
+
+# Static MCP config paths for each platform; Claude Code's plugin configs
+# are discovered at run time (see get_mcp_paths)
+_MCP_PATHS: Dict[Platform, Dict[str, Path]] = {
+    Platform.CLAUDE_CODE: {"global": _HOME / ".claude.json"},
+    Platform.CODEX: {"global": _HOME / ".codex" / "config.toml"},
+    Platform.OPENCODE: {"global": _HOME / ".config" / "opencode" / "opencode.json"},
+    Platform.CURSOR: {"global": _HOME / ".cursor" / "mcp.json"},
+    Platform.GEMINI: {"global": _HOME / ".gemini" / "settings.json"},
+}
+
+_DISPLAY_NAMES: Dict[Platform, str] = {
+    Platform.CLAUDE_CODE: "Claude Code",
+    Platform.OPENCODE: "OpenCode",
+    Platform.CODEX: "Codex",
+    Platform.CURSOR: "Cursor",
+    Platform.GEMINI: "Gemini CLI",
+}
+
+
+@lru_cache(maxsize=None)
 def _get_installed_plugin_paths() -> List[Path]:
     """
     Get paths of installed Claude plugins from installed_plugins.json.
@@ -23,16 +64,12 @@ def _get_installed_plugin_paths() -> List[Path]:
     since marketplaces/ contains all available plugins while installed_plugins.json
     tracks only what the user has actually installed.
     """
-    home = Path.home()
-    installed_file = home / ".claude" / "plugins" / "installed_plugins.json"
+    installed_file = CLAUDE_PLUGINS_DIR / "installed_plugins.json"
     plugin_paths = []
 
-    if not installed_file.exists():
-        return plugin_paths
-
+    # A missing file raises FileNotFoundError (an IOError), handled below
     try:
-        with open(installed_file, 'r') as f:
-            data = json.load(f)
+        data = _json.loads(installed_file.read_bytes())
 
         plugins = data.get("plugins", {})
         for plugin_key, installs in plugins.items():
@@ -43,7 +80,7 @@ def _get_installed_plugin_paths() -> List[Path]:
                     install_path = install.get("installPath")
                     if install_path:
                         path = Path(install_path)
-                        if path.exists() and path.is_dir():
+                        if path.is_dir():
                             plugin_paths.append(path)
     except (json.JSONDecodeError, IOError):
         pass
@@ -51,6 +88,7 @@ def _get_installed_plugin_paths() -> List[Path]:
     return plugin_paths
 
 
+@lru_cache(maxsize=None)
 def _discover_claude_plugin_paths() -> List[Path]:
     """Discover skill paths from installed Claude plugins."""
     plugin_paths = _get_installed_plugin_paths()
@@ -58,9 +96,9 @@ def _discover_claude_plugin_paths() -> List[Path]:
 
     for plugin_path in plugin_paths:
         # Search for 'skills' directories within each installed plugin
-        for path in plugin_path.rglob("skills"):
-            if path.is_dir():
-                skill_paths.append(path)
+        for path in iter_named(plugin_path, "skills"):
+            if os.path.isdir(path):
+                skill_paths.append(Path(path))
 
         # Also include the plugin directory itself for recursive scanning
         skill_paths.append(plugin_path)
@@ -68,9 +106,21 @@ def _discover_claude_plugin_paths() -> List[Path]:
     return skill_paths
 
 
+@lru_cache(maxsize=None)
+def _platform_paths(platform: Platform) -> Tuple[Path, ...]:
+    """Skill paths for a platform, computed once per platform per process."""
+    if platform == Platform.CLAUDE_CODE:
+        # Base paths for Claude Code, plus discovered plugin paths
+        return tuple(_SKILL_PATHS[platform] + _discover_claude_plugin_paths())
+
+    return tuple(_SKILL_PATHS.get(platform, []))
+
+
 def get_platform_paths(platform: Platform) -> List[Path]:
     """
     Get all skill paths for a given platform.
+    The paths are computed once per platform per process; each call
+    returns a new list, which the caller may modify.
     
     Args:
         platform: The platform enum
@@ -78,65 +128,25 @@ def get_platform_paths(platform: Platform) -> List[Path]:
     Returns:
         List of Path objects for skill directories
     """
-    home = Path.home()
-    
-    # Base paths for Claude Code
-    claude_base_paths = [
-        home / ".claude" / "skills",
-    ]
-    # Add discovered plugin paths
-    claude_base_paths.extend(_discover_claude_plugin_paths())
-    
-    platform_paths = {
-        Platform.CLAUDE_CODE: claude_base_paths,
-        Platform.OPENCODE: [
-            home / ".opencode" / "skill",
-        ],
-        Platform.CODEX: [
-            home / ".codex" / "skills",
-        ],
-        Platform.CURSOR: [
-            home / ".cursor" / "skills",
-        ],
-        Platform.GEMINI: [
-            home / ".gemini" / "skills",
-        ],
-    }
-    
-    return platform_paths.get(platform, [])
+    return list(_platform_paths(platform))
 
 
+@lru_cache(maxsize=None)
 def get_mcp_paths(platform: Platform) -> dict:
     """
     Get MCP config file paths for a platform.
+    Computed once per platform per process; callers must not mutate the dict.
 
     Returns:
         Dictionary with 'global' and optionally 'plugins' (list of paths)
     """
-    home = Path.home()
-
-    mcp_paths = {
-        Platform.CLAUDE_CODE: {
-            "global": home / ".claude.json",
-            "plugins": _get_installed_plugin_paths(),
-        },
-        Platform.CODEX: {
-            "global": home / ".codex" / "config.toml",
-        },
-        Platform.OPENCODE: {
-            "global": home / ".config" / "opencode" / "opencode.json",
-        },
-        Platform.CURSOR: {
-            "global": home / ".cursor" / "mcp.json",
-        },
-        Platform.GEMINI: {
-            "global": home / ".gemini" / "settings.json",
-        },
-    }
-
-    return mcp_paths.get(platform, {})
+    if platform == Platform.CLAUDE_CODE:
+        return {**_MCP_PATHS[platform], "plugins": _get_installed_plugin_paths()}
+
+    return _MCP_PATHS.get(platform, {})
 
 
+@lru_cache(maxsize=None)
 def get_all_platforms() -> Dict[str, Platform]:
     """Get all platforms as a dictionary."""
     return {p.value: p for p in Platform}
@@ -144,11 +154,4 @@ def get_all_platforms() -> Dict[str, Platform]:
 
 def get_platform_display_name(platform: Platform) -> str:
     """Get a display name for the platform."""
-    names = {
-        Platform.CLAUDE_CODE: "Claude Code",
-        Platform.OPENCODE: "OpenCode",
-        Platform.CODEX: "Codex",
-        Platform.CURSOR: "Cursor",
-        Platform.GEMINI: "Gemini CLI",
-    }
-    return names.get(platform, platform.value)
+    return _DISPLAY_NAMES.get(platform, platform.value)
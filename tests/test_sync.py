@@ -0,0 +1,129 @@
+"""Tests for copying skill trees and MCP configs between platforms."""
+
+import os
+
+from agents_sync import _json
+from agents_sync._fs import tree_signature, write_bytes_if_changed
+from agents_sync.core import _copy_skill_trees
+from agents_sync.mcp import _write_section
+from agents_sync.platforms import Platform
+
+
+def _make_skill(root):
+    skill = root / "my-skill"
+    skill.mkdir(parents=True)
+    (skill / "SKILL.md").write_text("# My skill\n")
+    script = skill / "run.sh"
+    script.write_text("#!/bin/sh\necho hi\n")
+    script.chmod(0o644)
+    return skill
+
+
+def test_unchanged_skill_is_skipped(tmp_path):
+    source = _make_skill(tmp_path / "master")
+    destination = tmp_path / "fork" / "my-skill"
+    jobs = [(source, destination)]
+
+    assert _copy_skill_trees(jobs, replace=True, skip_unchanged=True) == 0
+    assert _copy_skill_trees(jobs, replace=True, skip_unchanged=True) == 1
+
+
+def test_mode_only_change_is_synced(tmp_path):
+    source = _make_skill(tmp_path / "master")
+    destination = tmp_path / "fork" / "my-skill"
+    jobs = [(source, destination)]
+    _copy_skill_trees(jobs, replace=True, skip_unchanged=True)
+
+    # chmod +x keeps the script's size and mtime
+    script = source / "run.sh"
+    stat_before = script.stat()
+    script.chmod(0o755)
+    os.utime(script, ns=(stat_before.st_atime_ns, stat_before.st_mtime_ns))
+    assert tree_signature(source) != tree_signature(destination)
+
+    assert _copy_skill_trees(jobs, replace=True, skip_unchanged=True) == 0
+    assert (destination / "run.sh").stat().st_mode & 0o777 == 0o755
+    assert tree_signature(source) == tree_signature(destination)
+
+
+def _make_tree(root, files):
+    root.mkdir(parents=True)
+    for name, text in files.items():
+        (root / name).write_text(text)
+    return root
+
+
+def test_backup_merges_skills_sharing_a_destination(tmp_path):
+    # e.g. ~/.claude/skills/foo and a plugin's skills/foo
+    first = _make_tree(tmp_path / "skills" / "foo", {"SKILL.md": "first", "a.txt": "a"})
+    second = _make_tree(tmp_path / "plugin" / "foo", {"SKILL.md": "second", "b.txt": "b"})
+    destination = tmp_path / "backup" / "foo"
+
+    _copy_skill_trees([(first, destination), (second, destination)], replace=False)
+
+    assert sorted(os.listdir(destination)) == ["SKILL.md", "a.txt", "b.txt"]
+    assert (destination / "SKILL.md").read_text() == "second"
+
+
+def test_sync_keeps_last_skill_for_a_shared_destination(tmp_path):
+    first = _make_tree(tmp_path / "skills" / "foo", {"SKILL.md": "first", "a.txt": "a"})
+    second = _make_tree(tmp_path / "plugin" / "foo", {"SKILL.md": "second", "b.txt": "b"})
+    destination = tmp_path / "fork" / "foo"
+
+    _copy_skill_trees([(first, destination), (second, destination)], replace=True)
+
+    assert sorted(os.listdir(destination)) == ["SKILL.md", "b.txt"]
+
+
+def test_nested_skill_from_another_root_is_copied(tmp_path):
+    # ~/.claude/skills/a plus a plugin-root skill whose relative path is a/b
+    outer = _make_tree(tmp_path / "skills" / "a", {"SKILL.md": "a"})
+    inner = _make_tree(tmp_path / "plugin" / "a" / "b", {"SKILL.md": "b"})
+    destination = tmp_path / "backup"
+    jobs = [(outer, destination / "a"), (inner, destination / "a" / "b")]
+
+    _copy_skill_trees(jobs, replace=False)
+
+    assert (destination / "a" / "SKILL.md").read_text() == "a"
+    assert (destination / "a" / "b" / "SKILL.md").read_text() == "b"
+
+
+def test_nested_skill_inside_copied_skill_counts_as_unchanged(tmp_path):
+    outer = _make_tree(tmp_path / "master" / "a", {"SKILL.md": "a"})
+    inner = _make_tree(outer / "b", {"SKILL.md": "b"})
+    destination = tmp_path / "fork"
+    jobs = [(inner, destination / "a" / "b"), (outer, destination / "a"), (outer, destination / "a")]
+
+    assert _copy_skill_trees(jobs, replace=True, skip_unchanged=True) == 0
+    assert (destination / "a" / "b" / "SKILL.md").read_text() == "b"
+    assert _copy_skill_trees(jobs, replace=True, skip_unchanged=True) == 3
+
+
+def test_identical_mcp_section_is_not_rewritten(tmp_path):
+    config = tmp_path / "mcp.json"
+    servers = {"github": {"command": "gh-mcp", "args": ["serve"]}}
+    config.write_text('{"theme": "dark"}')
+
+    assert _write_section(Platform.CURSOR, config, servers) == 0
+    written = config.read_bytes()
+    stat_written = config.stat()
+    assert _json.loads(written) == {"theme": "dark", "mcpServers": servers}
+
+    assert _write_section(Platform.CURSOR, config, servers) == 1
+    assert config.stat().st_ino == stat_written.st_ino
+    assert config.stat().st_mtime_ns == stat_written.st_mtime_ns
+
+    changed = {**servers, "docs": {"type": "http", "url": "https://example.com/mcp"}}
+    assert _write_section(Platform.CURSOR, config, changed) == 1
+    assert _json.loads(config.read_bytes())["mcpServers"] == changed
+
+
+def test_write_bytes_if_changed_skips_identical_content(tmp_path):
+    path = tmp_path / "file.txt"
+
+    assert write_bytes_if_changed(path, b"same") is True
+    inode = path.stat().st_ino
+    assert write_bytes_if_changed(path, b"same") is False
+    assert path.stat().st_ino == inode
+    assert write_bytes_if_changed(path, b"different") is True
+    assert path.read_bytes() == b"different"